@@ -3,11 +3,17 @@ try:
     from ttkbootstrap.constants import *
 except ImportError:
     raise ImportError("ttkbootstrap is not installed. Please run 'pip install ttkbootstrap' in your terminal.")
-from tkinter import messagebox, scrolledtext, Listbox
+from tkinter import filedialog, messagebox, scrolledtext, Listbox
+import asyncio
+import hashlib
+import re
 import subprocess
 import threading
+import time
 import json
 import os
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 import posixpath
@@ -19,6 +25,121 @@ from managers.config_manager import ConfigManager
 from managers.palworld_config_manager import PalworldConfigManager
 from managers.server_manager import PalworldServerManager
 
+# Compiled once; scans SteamCMD stderr for shell "unknown command" errors
+# without re-walking the whole output per substring check
+_STEAMCMD_ERR_RE = re.compile(r"command not found|not recognized")
+
+# Shared dialog constants, built once instead of per click
+EXE_FILETYPES = (("Executable files", "*.exe"), ("All files", "*.*"))
+
+# Section groupings for the settings form, in display order
+SETTINGS_SECTIONS = {
+    "Server Settings": ["ServerName", "ServerDescription", "AdminPassword", "ServerPassword",
+                      "ServerPlayerMaxNum", "PublicIP", "PublicPort"],
+    "Game Balance": ["Difficulty", "DayTimeSpeedRate", "NightTimeSpeedRate", "ExpRate",
+                   "DeathPenalty", "GuildPlayerMaxNum"],
+    "Pal Settings": ["PalCaptureRate", "PalSpawnNumRate", "PalDamageRateAttack", "PalDamageRateDefense",
+                   "PalStaminaDecreaceRate", "PalStomachDecreaceRate", "PalAutoHPRegeneRate",
+                   "PalAutoHpRegeneRateInSleep", "PalEggDefaultHatchingTime"],
+    "Player Settings": ["PlayerDamageRateAttack", "PlayerDamageRateDefense", "PlayerStaminaDecreaceRate",
+                      "PlayerStomachDecreaceRate", "PlayerAutoHPRegeneRate", "PlayerAutoHpRegeneRateInSleep"],
+    "Base Camp": ["BaseCampMaxNumInGuild", "BaseCampWorkerMaxNum"],
+    "Building": ["BuildObjectDamageRate", "BuildObjectDeteriorationDamageRate", "MaxBuildingLimitNum"],
+    "Collection": ["CollectionDropRate", "CollectionObjectHpRate", "CollectionObjectRespawnSpeedRate"],
+    "Enemy & Items": ["EnemyDropItemRate", "ItemWeightRate", "EquipmentDurabilityDamageRate"],
+    "Gameplay Features": ["bEnableFastTravel", "bEnableInvaderEnemy", "bHardcore", "bPalLost",
+                        "bShowPlayerList", "bCharacterRecreateInHardcore", "bInvisibleOtherGuildBaseCampAreaFX",
+                        "bIsRandomizerPalLevelRandom", "bIsUseBackupSaveData", "bBuildAreaLimit",
+                        "bAllowGlobalPalboxExport", "bAllowGlobalPalboxImport"],
+    "Randomizer": ["RandomizerSeed", "RandomizerType"],
+    "Crossplay": ["CrossplayPlatforms", "AllowConnectPlatform"],
+    "Chat & Supply": ["ChatPostLimitPerMinute", "SupplyDropSpan"],
+    "Sync Settings": ["ServerReplicatePawnCullDistance", "ItemContainerForceMarkDirtyInterval"],
+    "API & Logging": ["RESTAPIEnabled", "RESTAPIPort", "RCONEnabled", "RCONPort", "LogFormatType"]
+}
+
+# Widget kinds for the settings form, branched on as plain ints
+_W_DROPDOWN, _W_CHECK, _W_ENTRY = range(3)
+
+def _build_section_schema():
+    """Flatten SETTINGS_SECTIONS against the known config fields.
+
+    Produces [(section_name, [(field_name, widget_kind, choices)])] so the
+    form-build loop branches on an int tag instead of re-doing dict
+    membership and isinstance checks per field on every build.
+    """
+    fields = PalworldConfigManager().get_config_fields()["PalWorldSettings"]
+    schema = []
+    for section_name, field_names in SETTINGS_SECTIONS.items():
+        rows = []
+        for field_name in field_names:
+            if field_name not in fields:
+                continue
+            value_type = fields[field_name]
+            if isinstance(value_type, list):  # dropdown
+                rows.append((field_name, _W_DROPDOWN, value_type))
+            elif value_type == bool:
+                rows.append((field_name, _W_CHECK, None))
+            else:
+                rows.append((field_name, _W_ENTRY, None))
+        schema.append((section_name, rows))
+    return schema
+
+SECTION_SCHEMA = _build_section_schema()
+
+PUTTY_HELP_TMPL = """
+Common PuTTY installation locations:
+• C:\\Program Files\\PuTTY\\
+• C:\\Program Files (x86)\\PuTTY\\
+• ~\\AppData\\Local\\Programs\\PuTTY\\
+
+IMPORTANT - SSH Key Authentication:
+1. Create a PuTTY session named '{session}' in PuTTY GUI
+2. Configure SSH connection details (hostname, port 22)
+3. Go to Connection → SSH → Auth → Credentials
+4. Browse to your private key file (.ppk format)
+5. Save the session
+6. Test the session in PuTTY GUI first
+
+If using password authentication:
+1. Create session as above but skip step 4
+2. PuTTY will prompt for password when needed
+
+Alternative - Direct Connection:
+If session doesn't work, use direct connection with host/IP, port, and username.
+        """
+
+# README contents cached by mtime so re-entering the tab does no disk IO
+_readme_cache = (None, None)
+
+def _load_readme(path="README.md"):
+    """Read README.md, re-reading only when the file changes on disk"""
+    global _readme_cache
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    if _readme_cache[0] != mtime:
+        with open(path, "r", encoding="utf-8") as f:
+            _readme_cache = (mtime, f.read())
+    return _readme_cache[1]
+
+class ConfigBoundVar(tb.StringVar):
+    """StringVar wired to a ConfigManager key.
+
+    Writes flow straight into the config dict, so dialogs no longer copy
+    each field back via update_config on save, and re-opening a dialog
+    reuses the same variable instead of re-reading the config.
+    """
+    def __init__(self, config_manager, key):
+        super().__init__(value=config_manager.get_config(key) or "")
+        self._config_manager = config_manager
+        self._key = key
+        self.trace_add("write", self._on_write)
+
+    def _on_write(self, *args):
+        self._config_manager.update_config(self._key, self.get())
+
 class PalworldConfigApp:
     def __init__(self, root):
         self.root = root
@@ -37,7 +158,48 @@ class PalworldConfigApp:
         # GUI state
         self.settings = {}
         self.inputs = {}
+        self._settings_form_built = False
+        self._last_saved_hash = None
+        # Digest of the last successfully uploaded config file; a Save with
+        # identical bytes skips the transfer entirely
+        self._last_uploaded_hash = None
+        self._player_names = []
+        # Verbose per-field logging is opt-in; it dominates form rendering
+        # time when enabled
+        self.debug_enabled = os.environ.get("PALGUI_DEBUG") == "1"
         self.auto_refresh_job = None
+        self._auto_refresh_task = None
+
+        # Short-TTL cache for API responses so auto-refresh and back-to-back
+        # button presses don't re-issue identical HTTP requests
+        self._api_cache = {}
+
+        # Last server-status snapshot, reused by bursts of status lookups
+        self._status_cache = {"fetchedAt": 0.0, "value": None}
+
+        # Pending console lines, flushed to the Text widget in one batch
+        self._log_queue = deque()
+        self._log_flush_scheduled = False
+
+        # Last server-logs snapshot: unchanged polls skip the repaint and
+        # grown logs append only the new suffix
+        self._last_logs_hash = None
+        self._last_logs_text = None
+
+        # One shared ConfigBoundVar per config key, reused across dialogs
+        self._config_vars = {}
+
+        # One bounded worker pool for all background SSH/API work: no
+        # per-click thread creation, and at most 4 concurrent SSH sessions
+        # so the server's MaxStartups limit is never tripped
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="palworld")
+
+        # Asyncio loop on a dedicated daemon thread: coroutines run
+        # continuously instead of in 10 ms slices pumped from the Tk
+        # mainloop, so streamed output arrives without pump latency.
+        # Coroutines must marshal widget updates through _ui.
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self._run_loop, name="palworld-asyncio", daemon=True).start()
 
         # Create main layout: sidebar (left) and content (right)
         self.main_frame = tb.Frame(root)
@@ -51,50 +213,26 @@ class PalworldConfigApp:
         self.content_area = tb.Frame(self.main_frame)
         self.content_area.pack(side="left", fill="both", expand=True)
 
-        # Create frames for each tab and call setup functions once
-        self.readme_frame = tb.Frame(self.content_area)
-        self.setup_readme_tab()
-        self.readme_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
-        self.readme_frame.lower()
-
-        self.config_frame = tb.Frame(self.content_area)
-        self.setup_config_tab()
-        self.config_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
-        self.config_frame.lower()
-
-        self.palworld_settings_frame = tb.Frame(self.content_area)
-        self.setup_palworld_settings_tab()
-        self.palworld_settings_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
-        self.palworld_settings_frame.lower()
-
-        self.api_frame = tb.Frame(self.content_area)
-        self.setup_api_tab()
-        self.api_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
-        self.api_frame.lower()
-
-        self.server_frame = tb.Frame(self.content_area)
-        self.setup_server_tab()
-        self.server_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
-        self.server_frame.lower()
-
-        # List of (icon, button text, frame)
+        # List of (icon, button text, setup function, frame); frames are built
+        # lazily the first time a tab is shown so startup only pays for the
+        # tab the user actually sees (and no SSH fires before Server Control
+        # is visited)
         self.tabs = [
-            ("📖", "README", self.readme_frame),
-            ("🛠️", "Server Configuration", self.config_frame),
-            ("📝", "Palworld Settings", self.palworld_settings_frame),
-            ("🔌", "API Control", self.api_frame),
-            ("🖥️", "Server Control", self.server_frame),
+            ("📖", "README", self.setup_readme_tab, None),
+            ("🛠️", "Server Configuration", self.setup_config_tab, None),
+            ("📝", "Palworld Settings", self.setup_palworld_settings_tab, None),
+            ("🔌", "API Control", self.setup_api_tab, None),
+            ("🖥️", "Server Control", self.setup_server_tab, None),
         ]
 
         self.tab_buttons = []
-        for idx, (icon, text, frame) in enumerate(self.tabs):
+        for idx, (icon, text, setup_fn, frame) in enumerate(self.tabs):
             btn = tb.Button(self.sidebar, text=f"{icon} {text}", width=22, bootstyle="secondary", command=lambda i=idx: self.show_tab(i))
             btn.pack(fill="x", pady=2, padx=4)
             self.tab_buttons.append(btn)
-        # Show the first tab by default
-        self.show_tab(0)
 
-        # Status and output console must be created before any setup_*_tab calls
+        # Status and output console must be created before the first show_tab
+        # call since lazy tab setup may log
         self.status = tb.StringVar()
         tb.Label(root, textvariable=self.status, foreground="blue").pack()
 
@@ -103,38 +241,130 @@ class PalworldConfigApp:
         self.output_console.insert(tb.END, "Console output will appear here...\n")
         self.output_console.config(state="disabled")
 
+        # Show the first tab by default
+        self.show_tab(0)
+
+        # Clean up the shared SSH connection when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Warm the SSH path in the background so the first click on a
+        # server action doesn't pay for connect + auth
+        self._submit(self._warmup)
+
+    def _warmup(self):
+        """Pre-authenticate SSH on a worker so the first action hits a warm pool.
+
+        Executable paths are already resolved (and cached) during
+        initialize_managers; the remaining cold cost is the SSH handshake.
+        """
+        ssh_manager = self.ssh_manager
+        if ssh_manager is not None and ssh_manager.use_direct_connection:
+            try:
+                ssh_manager.test_sftp_connection()
+            except Exception:
+                # Purely opportunistic; real actions will report errors
+                pass
+
+    def on_close(self):
+        """Close managers and destroy the window"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.executor.shutdown(wait=False)
+        if self.ssh_manager:
+            self.ssh_manager.close()
+        self.root.destroy()
+
+    def _submit(self, fn, *args):
+        """Run a blocking callable on the shared worker pool.
+
+        Exceptions are reported on the Tk thread instead of dying silently
+        in the worker.
+        """
+        future = self.executor.submit(fn, *args)
+
+        def report(fut):
+            exc = fut.exception()
+            if exc is not None:
+                self.root.after(0, lambda: self.log(f"❌ Background task failed: {exc}"))
+        future.add_done_callback(report)
+        return future
+
+    def _run_loop(self):
+        """Thread target: run the asyncio loop until the app closes"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run_async(self, coro):
+        """Schedule a coroutine on the background asyncio loop.
+
+        Returns a concurrent.futures.Future; cancelling it cancels the task.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def _ui(self, fn, *args, **kwargs):
+        """Run a widget update on the Tk thread; coroutines must not touch Tk"""
+        self.root.after(0, lambda: fn(*args, **kwargs))
+
+    async def _confirm(self, title, message):
+        """Ask a yes/no question from a coroutine without blocking the loop.
+
+        The dialog runs on the Tk thread; only this coroutine waits for
+        the answer, so streams and other tasks keep running behind it.
+        """
+        fut = Future()
+        self.root.after(0, lambda: fut.set_result(messagebox.askyesno(title, message)))
+        return await asyncio.wrap_future(fut)
+
+    def run_in_executor(self, fn, *args):
+        """Run a blocking call on the shared pool, awaitable from a coroutine"""
+        return self.loop.run_in_executor(self.executor, fn, *args)
+
     def initialize_managers(self):
         """Initialize SSH and API managers"""
+        # One snapshot instead of a dozen individual get_config lookups
+        cfg = self.config_manager.snapshot()
+
         # Initialize SSH manager
         plink_path = self.config_manager.get_plink_path()
         pscp_path = self.config_manager.get_pscp_path()
-        session_name = self.config_manager.get_config("PUTTY_SESSION")
-        
+        session_name = cfg.get("PUTTY_SESSION")
+
         if plink_path and pscp_path:
             self.ssh_manager = SSHManager(plink_path, pscp_path, session_name)
-            
+
             # Configure direct connection if enabled
-            if self.config_manager.get_config("USE_DIRECT_CONNECTION"):
-                host = self.config_manager.get_config("SSH_HOST")
-                port = self.config_manager.get_config("SSH_PORT")
-                username = self.config_manager.get_config("SSH_USERNAME")
+            if cfg.get("USE_DIRECT_CONNECTION"):
+                host = cfg.get("SSH_HOST")
+                port = cfg.get("SSH_PORT")
+                username = cfg.get("SSH_USERNAME")
                 if host and username:
                     self.ssh_manager.set_direct_connection(host, port, username)
-        
+
+            # Hold one shared connection open so each plink/pscp invocation
+            # attaches to it instead of paying a full SSH handshake
+            self.ssh_manager.start_master_connection()
+
         # Initialize API manager
-        api_base = self.config_manager.get_config("PALWORLD_API_BASE")
-        api_username = self.config_manager.get_config("PALWORLD_API_USERNAME")
-        api_password = self.config_manager.get_config("PALWORLD_API_PASSWORD")
-        
+        api_base = cfg.get("PALWORLD_API_BASE")
+        api_username = cfg.get("PALWORLD_API_USERNAME")
+        api_password = cfg.get("PALWORLD_API_PASSWORD")
+
         if api_base and api_username and api_password:
             self.api_manager = PalworldAPIManager(api_base, api_username, api_password)
-            
+
         # Initialize Server manager
-        server_path = self.config_manager.get_config("SERVER_PATH") or "~/Steam/steamapps/common/PalServer"
-        screen_session = self.config_manager.get_config("SCREEN_SESSION") or "palworld_server"
-        steamcmd_path = self.config_manager.get_config("STEAMCMD_PATH") or "steamcmd"
+        server_path = cfg.get("SERVER_PATH") or "~/Steam/steamapps/common/PalServer"
+        screen_session = cfg.get("SCREEN_SESSION") or "palworld_server"
+        steamcmd_path = cfg.get("STEAMCMD_PATH") or "steamcmd"
         self.server_manager = PalworldServerManager(server_path, screen_session, self.ssh_manager, steamcmd_path)
 
+    def config_var(self, key: str) -> ConfigBoundVar:
+        """Get (or create) the shared ConfigBoundVar for a config key"""
+        var = self._config_vars.get(key)
+        if var is None:
+            var = ConfigBoundVar(self.config_manager, key)
+            self._config_vars[key] = var
+        return var
+
     def check_putty_tools(self):
         """Check if PuTTY tools are available and show configuration dialog if needed"""
         plink_path = self.config_manager.get_plink_path()
@@ -145,63 +375,72 @@ class PalworldConfigApp:
         else:
             self.log(f"✅ PuTTY tools found: {plink_path}, {pscp_path}")
 
-    def show_putty_config_dialog(self):
-        """Show dialog to configure PuTTY paths"""
+    def _build_settings_dialog(self, title, geometry, heading, fields):
+        """Construct a settings Toplevel from a field list in one loop.
+
+        Each field is (label, key_or_var, width, show): key_or_var is a
+        config key (bound via config_var so edits write through) or a
+        ready-made StringVar for values that should not touch the config,
+        or None for a bold section heading with no entry. Returns the
+        dialog plus the variables and entries in field order (None for
+        heading rows).
+        """
         dialog = tb.Toplevel(self.root)
-        dialog.title("PuTTY Configuration")
-        dialog.geometry("600x450")
+        dialog.title(title)
+        dialog.geometry(geometry)
         dialog.transient(self.root)
         dialog.grab_set()
 
-        tb.Label(dialog, text="PuTTY tools not found. Please configure the paths:", font=("Arial", 10, "bold")).pack(pady=10)
+        tb.Label(dialog, text=heading, font=("Arial", 10, "bold")).pack(pady=10)
+
+        variables = []
+        entries = []
+        for label, key_or_var, width, show in fields:
+            if key_or_var is None:
+                tb.Label(dialog, text=label, font=("Arial", 9, "bold")).pack(anchor="w", padx=20, pady=(10, 5))
+                variables.append(None)
+                entries.append(None)
+                continue
+            tb.Label(dialog, text=label).pack(anchor="w", padx=20)
+            var = self.config_var(key_or_var) if isinstance(key_or_var, str) else key_or_var
+            entry = tb.Entry(dialog, textvariable=var, width=width, show=show or "")
+            entry.pack(padx=20, pady=5, fill="x")
+            variables.append(var)
+            entries.append(entry)
+        return dialog, variables, entries
 
-        # Plink path
-        tb.Label(dialog, text="Plink Path:").pack(anchor="w", padx=20)
-        plink_var = tb.StringVar(value=self.config_manager.get_plink_path() or "")
-        plink_entry = tb.Entry(dialog, textvariable=plink_var, width=50)
-        plink_entry.pack(padx=20, pady=5, fill="x")
-
-        # PSCP path
-        tb.Label(dialog, text="PSCP Path:").pack(anchor="w", padx=20)
-        pscp_var = tb.StringVar(value=self.config_manager.get_pscp_path() or "")
-        pscp_entry = tb.Entry(dialog, textvariable=pscp_var, width=50)
-        pscp_entry.pack(padx=20, pady=5, fill="x")
-
-        # Session name
-        tb.Label(dialog, text="PuTTY Session Name:").pack(anchor="w", padx=20)
-        session_var = tb.StringVar(value=self.config_manager.get_config("PUTTY_SESSION"))
-        session_entry = tb.Entry(dialog, textvariable=session_var, width=30)
-        session_entry.pack(padx=20, pady=5, fill="x")
-
-        # Direct connection options
-        tb.Label(dialog, text="Direct Connection (if session doesn't work):", font=("Arial", 9, "bold")).pack(anchor="w", padx=20, pady=(10,5))
-        
-        # Host
-        tb.Label(dialog, text="Host/IP:").pack(anchor="w", padx=20)
+    def show_putty_config_dialog(self):
+        """Show dialog to configure PuTTY paths"""
+        # Shared config-bound vars; seed the paths with auto-detection
+        plink_var = self.config_var("PLINK_PATH")
+        if not plink_var.get():
+            plink_var.set(self.config_manager.get_plink_path() or "")
+        pscp_var = self.config_var("PSCP_PATH")
+        if not pscp_var.get():
+            pscp_var.set(self.config_manager.get_pscp_path() or "")
+        session_var = self.config_var("PUTTY_SESSION")
+        # Direct connection options are session-local, not persisted
         host_var = tb.StringVar()
-        host_entry = tb.Entry(dialog, textvariable=host_var, width=30)
-        host_entry.pack(padx=20, pady=5, fill="x")
-        
-        # Port
-        tb.Label(dialog, text="Port:").pack(anchor="w", padx=20)
         port_var = tb.StringVar(value="22")
-        port_entry = tb.Entry(dialog, textvariable=port_var, width=10)
-        port_entry.pack(padx=20, pady=5, fill="x")
-        
-        # Username
-        tb.Label(dialog, text="Username:").pack(anchor="w", padx=20)
         username_var = tb.StringVar()
-        username_entry = tb.Entry(dialog, textvariable=username_var, width=30)
-        username_entry.pack(padx=20, pady=5, fill="x")
+
+        dialog, _, _ = self._build_settings_dialog(
+            "PuTTY Configuration", "600x450",
+            "PuTTY tools not found. Please configure the paths:",
+            [
+                ("Plink Path:", plink_var, 50, None),
+                ("PSCP Path:", pscp_var, 50, None),
+                ("PuTTY Session Name:", session_var, 30, None),
+                ("Direct Connection (if session doesn't work):", None, 0, None),
+                ("Host/IP:", host_var, 30, None),
+                ("Port:", port_var, 10, None),
+                ("Username:", username_var, 30, None),
+            ])
 
         # Test connection button
         def test_connection():
-            # Update config manager
-            self.config_manager.update_config("PLINK_PATH", plink_var.get())
-            self.config_manager.update_config("PSCP_PATH", pscp_var.get())
-            self.config_manager.update_config("PUTTY_SESSION", session_var.get())
-            
-            # Reinitialize SSH manager
+            # Config values already track the entries via ConfigBoundVar;
+            # just reinitialize the SSH manager
             self.ssh_manager = SSHManager(plink_var.get(), pscp_var.get(), session_var.get())
             
             # Test both session and direct connection
@@ -226,19 +465,17 @@ class PalworldConfigApp:
 
         # Browse buttons
         def browse_plink():
-            from tkinter import filedialog
             filename = filedialog.askopenfilename(
                 title="Select Plink executable",
-                filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
+                filetypes=EXE_FILETYPES
             )
             if filename:
                 plink_var.set(filename)
 
         def browse_pscp():
-            from tkinter import filedialog
             filename = filedialog.askopenfilename(
                 title="Select PSCP executable",
-                filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
+                filetypes=EXE_FILETYPES
             )
             if filename:
                 pscp_var.set(filename)
@@ -248,47 +485,28 @@ class PalworldConfigApp:
         tb.Button(browse_frame, text="🔎 Browse Plink", bootstyle="info", command=browse_plink).pack(side="left", padx=5)
         tb.Button(browse_frame, text="🔎 Browse PSCP", bootstyle="info", command=browse_pscp).pack(side="left", padx=5)
 
-        # Help text
-        help_text = """
-Common PuTTY installation locations:
-• C:\\Program Files\\PuTTY\\
-• C:\\Program Files (x86)\\PuTTY\\
-• ~\\AppData\\Local\\Programs\\PuTTY\\
-
-IMPORTANT - SSH Key Authentication:
-1. Create a PuTTY session named '{session}' in PuTTY GUI
-2. Configure SSH connection details (hostname, port 22)
-3. Go to Connection → SSH → Auth → Credentials
-4. Browse to your private key file (.ppk format)
-5. Save the session
-6. Test the session in PuTTY GUI first
-
-If using password authentication:
-1. Create session as above but skip step 4
-2. PuTTY will prompt for password when needed
-
-Alternative - Direct Connection:
-If session doesn't work, use direct connection with host/IP, port, and username.
-        """.format(session=self.config_manager.get_config("PUTTY_SESSION"))
+        # Help text (template hoisted to module level; only the session
+        # substitution runs per dialog open)
+        help_text = PUTTY_HELP_TMPL.format(session=self.config_manager.get_config("PUTTY_SESSION"))
         
         help_label = tb.Label(dialog, text=help_text, justify="left", font=("Arial", 8))
         help_label.pack(pady=10, padx=20, anchor="w")
 
     def setup_readme_tab(self):
         """Display the README file contents in the first tab"""
-        import os
+        self.readme_frame = tb.Frame(self.content_area)
         readme_text = scrolledtext.ScrolledText(self.readme_frame, height=30, width=100)
         readme_text.pack(fill="both", expand=True, padx=10, pady=10)
-        readme_path = "README.md"
-        if os.path.exists(readme_path):
-            with open(readme_path, "r", encoding="utf-8") as f:
-                content = f.read()
+        content = _load_readme()
+        if content is not None:
             readme_text.insert(tb.END, content)
         else:
             readme_text.insert(tb.END, "README.md file not found in the project directory.")
         readme_text.config(state="disabled")
+        return self.readme_frame
 
     def setup_config_tab(self):
+        self.config_frame = tb.Frame(self.content_area)
         # Settings button
         settings_frame = tb.Frame(self.config_frame)
         settings_frame.pack(fill="x", padx=10, pady=5)
@@ -322,13 +540,15 @@ If session doesn't work, use direct connection with host/IP, port, and username.
                 self.log(f"[SteamCMD stdout]:\n{stdout}")
             if stderr:
                 self.log(f"[SteamCMD stderr]:\n{stderr}")
-            if (stderr and ("command not found" in stderr or "not recognized" in stderr)) or (not stdout and not stderr):
+            if (stderr and _STEAMCMD_ERR_RE.search(stderr)) or (not stdout and not stderr):
                 self.log("❌ SteamCMD test failed: Path is incorrect or SteamCMD is not executable.")
             else:
                 self.log("✅ SteamCMD test completed. If you see a version or exit message above, the path is correct.")
         tb.Button(steamcmd_frame, text="🔍 Test SteamCMD", bootstyle="info", command=test_steamcmd, width=15).pack(side="left", padx=5)
+        return self.config_frame
 
     def setup_palworld_settings_tab(self):
+        self.palworld_settings_frame = tb.Frame(self.content_area)
         # Download, save, and settings form (remove upload button)
         tb.Button(self.palworld_settings_frame, text="⬇ Download Config", bootstyle="info", command=self.download_config, width=40).pack(pady=2)
         # Info label shown if config is not loaded
@@ -345,8 +565,10 @@ If session doesn't work, use direct connection with host/IP, port, and username.
             # Hide the settings form frame if not loaded
             for widget in self.frame.winfo_children():
                 widget.destroy()
+        return self.palworld_settings_frame
 
     def setup_api_tab(self):
+        self.api_frame = tb.Frame(self.content_area)
         # API Settings button
         api_settings_frame = tb.Frame(self.api_frame)
         api_settings_frame.pack(fill="x", padx=10, pady=5)
@@ -375,9 +597,11 @@ If session doesn't work, use direct connection with host/IP, port, and username.
         tb.Button(player_buttons_frame, text="🔄 Refresh Players", bootstyle="info", command=self.refresh_players).pack(side="left", padx=2)
         tb.Button(player_buttons_frame, text="🚫 Kick Player", bootstyle="danger", command=self.kick_selected_player).pack(side="left", padx=2)
         tb.Button(player_buttons_frame, text="🔨 Ban Player", bootstyle="danger", command=self.ban_selected_player).pack(side="left", padx=2)
+        return self.api_frame
 
     def setup_server_tab(self):
         """Setup the server control tab"""
+        self.server_frame = tb.Frame(self.content_area)
         # Server Status Section
         status_frame = tb.LabelFrame(self.server_frame, text="Server Status", padding=10)
         status_frame.pack(fill="x", padx=10, pady=5)
@@ -435,77 +659,74 @@ If session doesn't work, use direct connection with host/IP, port, and username.
         
         # Add after the Update Server button in setup_server_tab
         def show_update_log():
-            if not self.server_manager:
+            if not self.server_manager or not self.ssh_manager:
                 self.log("❌ Server manager not initialized. Please configure server settings.")
                 return
-            def fetch_log():
-                server_manager = self.server_manager
-                if server_manager is None:
-                    return
-                log_text, error = server_manager.get_update_log(50)
-                running = server_manager.is_update_running()
-                status = "Update running..." if running else "Update complete."
-                popup = tb.Toplevel(self.root)
-                popup.title("SteamCMD Update Log")
-                popup.geometry("700x500")
-                status_label = tb.Label(popup, text=status, foreground="green" if running else "blue")
-                status_label.pack(pady=5)
-                log_box = scrolledtext.ScrolledText(popup, height=25, width=90)
-                log_box.pack(padx=10, pady=10, fill="both", expand=True)
-                log_box.insert(tb.END, log_text if log_text is not None else (error if error is not None else ""))
-                log_box.config(state="disabled")
-                auto_refresh_var = tb.BooleanVar(value=True)
-                def refresh_log(auto=False):
-                    log_box.config(state="normal")
-                    new_log, new_error = server_manager.get_update_log(50)
-                    log_box.delete(1.0, tb.END)
-                    log_box.insert(tb.END, new_log if new_log is not None else (new_error if new_error is not None else ""))
-                    log_box.config(state="disabled")
-                    running_now = server_manager.is_update_running()
-                    popup.title(f"SteamCMD Update Log - {'Running' if running_now else 'Complete'}")
-                    status_label.config(text="Update running..." if running_now else "Update complete.", foreground="green" if running_now else "blue")
-                    if auto_refresh_var.get() and running_now and auto:
-                        popup.after(5000, lambda: refresh_log(auto=True))
-                def on_auto_refresh_toggle():
-                    if auto_refresh_var.get():
-                        refresh_log(auto=True)
-                tb.Button(popup, text="Refresh", command=refresh_log).pack(pady=5)
-                tb.Checkbutton(popup, text="Auto-refresh every 5s", variable=auto_refresh_var, command=on_auto_refresh_toggle).pack()
-                if running:
-                    popup.after(5000, lambda: refresh_log(auto=True))
-            threading.Thread(target=fetch_log).start()
+            popup = tb.Toplevel(self.root)
+            popup.title("SteamCMD Update Log")
+            popup.geometry("700x500")
+            status_label = tb.Label(popup, text="Connecting...", foreground="blue")
+            status_label.pack(pady=5)
+            log_box = scrolledtext.ScrolledText(popup, height=25, width=90)
+            log_box.pack(padx=10, pady=10, fill="both", expand=True)
+            log_box.config(state="disabled")
+            # Stream new log lines over the shared SSH connection instead of
+            # re-fetching the whole tail every 5 seconds
+            task = self.run_async(self._stream_update_log(popup, log_box, status_label))
+            popup.protocol("WM_DELETE_WINDOW", lambda: (task.cancel(), popup.destroy()))
         tb.Button(control_buttons_frame, text="📄 View Update Log", bootstyle="info", command=show_update_log, width=18).pack(side="left", padx=2)
         
-        # Initial status check
-        self.refresh_server_status()
+        # Initial status check, deferred until the tab has painted so window
+        # construction is never blocked behind the SSH round-trip
+        self.root.after_idle(self.refresh_server_status)
+        return self.server_frame
+
+    async def _stream_update_log(self, popup, log_box, status_label):
+        """Tail the SteamCMD update log and append only new lines as they arrive"""
+        ssh_manager = self.ssh_manager
+        server_manager = self.server_manager
+        assert ssh_manager is not None and server_manager is not None
+
+        def append(line):
+            log_box.config(state="normal")
+            log_box.insert(tb.END, line + "\n")
+            log_box.see(tb.END)
+            log_box.config(state="disabled")
+
+        try:
+            running = await self.run_in_executor(server_manager.is_update_running)
+            self._ui(status_label.config,
+                     text="Update running..." if running else "Update complete.",
+                     foreground="green" if running else "blue")
+            self._ui(popup.title, f"SteamCMD Update Log - {'Running' if running else 'Complete'}")
+
+            async for line in ssh_manager.stream_command("tail -n 50 -f ~/steamcmd_update.log"):
+                self._ui(append, line)
+        except asyncio.CancelledError:
+            # Popup was closed; nothing to update
+            raise
+        except Exception as e:
+            # Show tail/stream failures (e.g. the log file not existing
+            # yet) in the popup instead of leaving it silently empty
+            def show_error(message=str(e)):
+                if not popup.winfo_exists():
+                    return
+                status_label.config(text=f"❌ {message}", foreground="red")
+                append(message)
+            self._ui(show_error)
 
     def show_api_config_dialog(self):
         """Show dialog to configure API settings"""
-        dialog = tb.Toplevel(self.root)
-        dialog.title("Palworld API Configuration")
-        dialog.geometry("500x350")
-        dialog.transient(self.root)
-        dialog.grab_set()
-
-        tb.Label(dialog, text="Palworld REST API Configuration:", font=("Arial", 10, "bold")).pack(pady=10)
-
-        # API Base URL
-        tb.Label(dialog, text="API Base URL:").pack(anchor="w", padx=20)
-        api_url_var = tb.StringVar(value=self.config_manager.get_config("PALWORLD_API_BASE"))
-        api_url_entry = tb.Entry(dialog, textvariable=api_url_var, width=50)
-        api_url_entry.pack(padx=20, pady=5, fill="x")
-
-        # API Username
-        tb.Label(dialog, text="Username:").pack(anchor="w", padx=20)
-        api_username_var = tb.StringVar(value=self.config_manager.get_config("PALWORLD_API_USERNAME"))
-        api_username_entry = tb.Entry(dialog, textvariable=api_username_var, width=50)
-        api_username_entry.pack(padx=20, pady=5, fill="x")
-
-        # API Password
-        tb.Label(dialog, text="Password:").pack(anchor="w", padx=20)
-        api_password_var = tb.StringVar(value=self.config_manager.get_config("PALWORLD_API_PASSWORD"))
-        api_password_entry = tb.Entry(dialog, textvariable=api_password_var, width=50, show="*")
-        api_password_entry.pack(padx=20, pady=5, fill="x")
+        dialog, variables, entries = self._build_settings_dialog(
+            "Palworld API Configuration", "500x350",
+            "Palworld REST API Configuration:",
+            [
+                ("API Base URL:", "PALWORLD_API_BASE", 50, None),
+                ("Username:", "PALWORLD_API_USERNAME", 50, None),
+                ("Password:", "PALWORLD_API_PASSWORD", 50, "*"),
+            ])
+        api_url_var, api_username_var, api_password_var = variables
+        api_password_entry = entries[2]
 
         # Show/Hide password checkbox
         show_password_var = tb.BooleanVar()
@@ -519,12 +740,8 @@ If session doesn't work, use direct connection with host/IP, port, and username.
 
         # Save button
         def save_api_config():
-            # Update config manager
-            self.config_manager.update_config("PALWORLD_API_BASE", api_url_var.get())
-            self.config_manager.update_config("PALWORLD_API_USERNAME", api_username_var.get())
-            self.config_manager.update_config("PALWORLD_API_PASSWORD", api_password_var.get())
-            
-            # Save to config.py so it persists after restart
+            # Config values already track the entries via ConfigBoundVar;
+            # save to config.py so they persist after restart
             self.config_manager.save_config_to_file()
             
             # Reinitialize API manager
@@ -554,13 +771,52 @@ API Configuration Help:
         help_label.pack(pady=10, padx=20, anchor="w")
 
     def log(self, text):
-        """Log message to console (thread-safe)"""
-        def append_log():
-            self.output_console.config(state="normal")
-            self.output_console.insert(tb.END, text + "\n")
-            self.output_console.see(tb.END)
-            self.output_console.config(state="disabled")
-        self.root.after(0, append_log)
+        """Log message to console (thread-safe); lines are flushed in batches"""
+        self._log_queue.append(text + "\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(50, self._flush_log)
+
+    MAX_CONSOLE_LINES = 5000
+
+    # How long cached API responses stay valid
+    API_CACHE_TTL = 5.0
+
+    def _cached_api(self, key, fetch):
+        """Return a cached API response if still fresh, otherwise fetch and cache it"""
+        entry = self._api_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.API_CACHE_TTL:
+            return entry[1]
+        value = fetch()
+        if value is not None:
+            self._api_cache[key] = (time.monotonic(), value)
+        return value
+
+    @staticmethod
+    def _trim_text_widget(widget, max_lines=MAX_CONSOLE_LINES):
+        """Drop the oldest lines so a Text widget's memory stays bounded"""
+        count = int(widget.index('end-1c').split('.')[0])
+        if count > max_lines:
+            widget.delete('1.0', f'{count - max_lines}.0')
+
+    def _flush_log(self):
+        """Insert all queued log lines with a single widget update"""
+        self._log_flush_scheduled = False
+        if not self._log_queue:
+            return
+        # Drain with atomic poplefts: join-then-clear would drop any line
+        # a worker appends between the two operations, and a line arriving
+        # after the drain reschedules since the flag is already cleared
+        queue = self._log_queue
+        lines = []
+        while queue:
+            lines.append(queue.popleft())
+        text = "".join(lines)
+        self.output_console.config(state="normal")
+        self.output_console.insert(tb.END, text)
+        self._trim_text_widget(self.output_console)
+        self.output_console.see(tb.END)
+        self.output_console.config(state="disabled")
 
     def test_putty_connection(self):
         """Test PuTTY connection to the server"""
@@ -580,123 +836,143 @@ API Configuration Help:
             self.log("❌ API manager not initialized. Please configure API settings.")
             return
             
-        def test_connection():
-            self.log("🔍 Testing Palworld API connection...")
-            # Type assertion to help linter
-            api_manager = self.api_manager
-            assert api_manager is not None
-            success, message = api_manager.test_connection()
-            if success:
-                self.log("✅ API connection test successful")
-                # Test with authentication
-                info = api_manager.get_server_info()
-                if info:
-                    self.log(f"✅ Server info: {json.dumps(info, indent=2)}")
-                    # Also display in the server info box
-                    self.server_info_text.config(state="normal")
-                    self.server_info_text.delete(1.0, tb.END)
-                    self.server_info_text.insert(tb.END, json.dumps(info, indent=2))
-                    self.server_info_text.config(state="disabled")
-                else:
-                    self.log("❌ Authentication failed")
-            else:
-                self.log(f"❌ API connection test failed: {message}")
-
-        threading.Thread(target=test_connection).start()
+        self.run_async(self._test_api_connection())
+
+    async def _test_api_connection(self):
+        """Coroutine driving the API connection test off the Tk main thread"""
+        self.log("🔍 Testing Palworld API connection...")
+        # Type assertion to help linter
+        api_manager = self.api_manager
+        assert api_manager is not None
+        # A successful authenticated get_server_info proves reachability and
+        # credentials in one request instead of an anonymous probe plus an
+        # authenticated fetch against the same endpoint
+        info = await self.run_in_executor(api_manager.get_server_info)
+        if info:
+            # Format once for both the log and the info box; ensure_ascii=False
+            # skips escaping every non-ASCII char in server/player names
+            pretty = json.dumps(info, indent=2, ensure_ascii=False)
+            self.log("✅ API connection test successful")
+            self.log(f"✅ Server info: {pretty}")
+
+            # Also display in the server info box
+            def show():
+                self.server_info_text.config(state="normal")
+                self.server_info_text.delete(1.0, tb.END)
+                self.server_info_text.insert(tb.END, pretty)
+                self.server_info_text.config(state="disabled")
+            self._ui(show)
+        else:
+            self.log("❌ API connection test failed (server unreachable or authentication rejected)")
 
     def download_config(self):
         """Download configuration file from server"""
         if not self.ssh_manager:
             self.log("❌ SSH manager not initialized. Please configure PuTTY paths.")
             return
+        self.run_async(self._download_config())
+
+    async def _download_config(self):
+        """Coroutine driving the config download off the Tk main thread"""
         try:
             self.log("⬇ Starting config download...")
-            remote_path = self.config_manager.get_config("REMOTE_CONFIG_PATH")
-            local_path = self.config_manager.get_config("LOCAL_CONFIG_PATH")
+            # One snapshot instead of a get_config (stat + dispatch) per key
+            cfg = self.config_manager.snapshot()
+            remote_path = cfg["REMOTE_CONFIG_PATH"]
+            local_path = cfg["LOCAL_CONFIG_PATH"]
             ssh_manager = self.ssh_manager
             assert ssh_manager is not None
-            # Always resolve the full remote path
-            full_remote_path, _ = ssh_manager.get_full_path(remote_path)
-            if not full_remote_path or not full_remote_path.strip():
-                self.log(f"⚠️ Could not resolve full path for config: {remote_path}")
-                # Try to resolve the directory and copy the default config
-                config_dir = os.path.dirname(remote_path)
-                default_path = "~/Steam/steamapps/common/PalServer/DefaultPalWorldSettings.ini"
-                full_default_path, _ = ssh_manager.get_full_path(default_path)
-                full_config_dir, _ = ssh_manager.get_full_path(config_dir)
-                if not full_default_path or not full_config_dir:
-                    self.log(f"❌ Could not resolve full path for default config or config directory.")
-                    self.status.set(f"❌ Could not resolve full path for default config or config directory.")
-                    return
-                full_target_path = posixpath.join(full_config_dir.strip(), os.path.basename(remote_path))
-                copy_cmd = f"cp '{full_default_path.strip()}' '{full_target_path}'"
-                stdout, stderr = ssh_manager.execute_command(copy_cmd)
-                if stderr:
-                    self.log(f"❌ Failed to copy default config: {stderr}")
-                    self.status.set(f"❌ Failed to copy default config: {stderr}")
-                    return
-                self.log(f"✅ Default config copied to {full_target_path}")
-                # Try to resolve the full path again
-                full_remote_path, _ = ssh_manager.get_full_path(remote_path)
-                if not full_remote_path or not full_remote_path.strip():
-                    self.log(f"❌ Still could not resolve full path for config after copying default.")
-                    self.status.set(f"❌ Still could not resolve full path for config after copying default.")
-                    return
-                full_remote_path = full_remote_path.strip()
-            else:
-                full_remote_path = full_remote_path.strip()
-            # Check if config file exists on server (use full path)
-            file_exists, _ = ssh_manager.test_file_exists(full_remote_path)
-            if not file_exists:
-                self.log(f"❌ Config file not found at {full_remote_path} even after attempting to copy default.")
-                self.status.set(f"❌ Config file not found at {full_remote_path} even after attempting to copy default.")
+            # Resolve the remote path, seed it from the default config if
+            # missing, and verify existence in one SSH round-trip instead
+            # of up to five sequential ones
+            config_dir = posixpath.dirname(remote_path)
+            config_name = posixpath.basename(remote_path)
+            default_path = "~/Steam/steamapps/common/PalServer/DefaultPalWorldSettings.ini"
+            probe_cmd = (
+                f'full=$(readlink -f {remote_path}); '
+                f'if [ ! -f "$full" ]; then '
+                f'dir=$(readlink -f {config_dir}) && def=$(readlink -f {default_path}) && '
+                f'mkdir -p "$dir" && cp "$def" "$dir/{config_name}" && full="$dir/{config_name}"; fi; '
+                f'if [ -f "$full" ]; then echo "OK $full"; else echo MISS; fi'
+            )
+            # Both remote steps run in the executor so the probe's cp and
+            # the transfer never block the Tk mainloop
+            stdout, stderr = await self.run_in_executor(ssh_manager.execute_command, probe_cmd)
+            result = (stdout or "").strip()
+            if not result.startswith("OK "):
+                self.log(f"❌ Config file not found at {remote_path} and copying the default failed: {stderr or result}")
+                self._ui(self.status.set, f"❌ Config file not found at {remote_path} even after attempting to copy default.")
                 return
-            success, message = ssh_manager.download_file(full_remote_path, local_path)
+            full_remote_path = result[3:].strip()
+            # The probe already returned an absolute, verified path; don't
+            # let download_file re-resolve it
+            success, message = await self.run_in_executor(
+                ssh_manager.download_file, full_remote_path, local_path, False)
             if success:
-                self.load_config()
-                self.palworld_info_label.pack_forget()
-                self.show_settings_form()
-                self.status.set("✅ Config downloaded and loaded.")
+                def on_success():
+                    self.load_config()
+                    self.palworld_info_label.pack_forget()
+                    self.show_settings_form()
+                    self.status.set("✅ Config downloaded and loaded.")
+                self._ui(on_success)
                 self.log("✅ Config file downloaded successfully.")
             else:
                 self.log(f"❌ Download failed: {message}")
-                self.status.set(f"❌ Download failed: {message}")
-                self.palworld_info_label.pack(pady=10)
-                for widget in self.frame.winfo_children():
-                    widget.destroy()
+                self._ui(self._download_failed_ui, f"❌ Download failed: {message}")
         except Exception as e:
             self.log(f"❌ Unexpected error: {str(e)}")
-            self.status.set(f"❌ Error: {str(e)}")
-            self.palworld_info_label.pack(pady=10)
-            for widget in self.frame.winfo_children():
-                widget.destroy()
+            self._ui(self._download_failed_ui, f"❌ Error: {str(e)}")
+
+    def _download_failed_ui(self, status_text):
+        """Reset the settings tab after a failed download (Tk thread only)"""
+        self.status.set(status_text)
+        self.palworld_info_label.pack(pady=10)
+        self._clear_settings_form()
 
     def upload_config(self):
-        """Upload configuration file to server"""
+        """Upload configuration file to server; returns True once the remote copy is current.
+
+        Runs on a worker (via _save_and_upload), so widget updates go
+        through _ui.
+        """
         if not self.ssh_manager:
             self.log("❌ SSH manager not initialized. Please configure PuTTY paths.")
-            return
-            
+            return False
+
         try:
             self.log("⬆ Starting config upload...")
-            local_path = self.config_manager.get_config("LOCAL_CONFIG_PATH")
-            remote_path = self.config_manager.get_config("REMOTE_CONFIG_PATH")
+            cfg = self.config_manager.snapshot()
+            local_path = cfg["LOCAL_CONFIG_PATH"]
+            remote_path = cfg["REMOTE_CONFIG_PATH"]
             
+            # Identical bytes on a repeated Save mean the remote copy is
+            # already current; skip the transfer round-trip
+            with open(local_path, "rb") as f:
+                digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            if digest == self._last_uploaded_hash:
+                self._ui(self.status.set, "✅ Config unchanged; upload skipped.")
+                self.log("✅ Config file unchanged since last upload; skipping transfer.")
+                return True
+
             # Type assertion to help linter
             ssh_manager = self.ssh_manager
             assert ssh_manager is not None
             success, message = ssh_manager.upload_file(local_path, remote_path)
-            
+
             if success:
-                self.status.set("✅ Config uploaded.")
+                self._last_uploaded_hash = digest
+                self._ui(self.status.set, "✅ Config uploaded.")
                 self.log("✅ Config file uploaded successfully.")
+                return True
             else:
                 self.log(f"❌ Upload failed: {message}")
-                self.status.set(f"❌ Upload failed: {message}")
-                
+                self._ui(self.status.set, f"❌ Upload failed: {message}")
+                return False
+
         except Exception as e:
             self.log(f"❌ Unexpected error: {str(e)}")
-            self.status.set(f"❌ Error: {str(e)}")
+            self._ui(self.status.set, f"❌ Error: {str(e)}")
+            return False
 
     def load_config(self):
         """Load Palworld configuration file"""
@@ -704,17 +980,44 @@ API Configuration Help:
         self.settings = self.palworld_config_manager.load_palworld_config(local_path)
         
         # Debug: Print loaded settings
-        self.log(f"📋 Loaded settings: {self.settings}")
-        if "PalWorldSettings" in self.settings:
-            self.log(f"📋 PalWorldSettings keys: {list(self.settings['PalWorldSettings'].keys())}")
-        else:
+        if self.debug_enabled:
+            self.log(f"📋 Loaded settings: {self.settings}")
+            if "PalWorldSettings" in self.settings:
+                self.log(f"📋 PalWorldSettings keys: {list(self.settings['PalWorldSettings'].keys())}")
+        if "PalWorldSettings" not in self.settings:
             self.log("❌ No PalWorldSettings section found in config file")
 
-    def show_settings_form(self):
-        """Show the settings form with organized sections"""
+    def _clear_settings_form(self):
+        """Tear down the settings form so the next show rebuilds it"""
         for widget in self.frame.winfo_children():
             widget.destroy()
+        self.inputs.clear()
+        self._settings_form_built = False
+
+    def show_settings_form(self):
+        """Show the settings form with organized sections"""
+        if self._settings_form_built:
+            self._refresh_settings_values()
+        else:
+            self._build_settings_form()
+
+    def _refresh_settings_values(self):
+        """Push freshly loaded settings into the existing form variables.
+
+        The widgets survive across downloads; refilling the variables is
+        far cheaper than destroying and recreating ~60 rows of labels and
+        inputs plus their geometry management.
+        """
+        palworld_settings = self.settings.get("PalWorldSettings", {})
+        for (section, field_name), var in self.inputs.items():
+            value = palworld_settings.get(field_name, "")
+            if isinstance(var, tb.BooleanVar):
+                var.set(str(value).lower() == "true")
+            else:
+                var.set(value)
 
+    def _build_settings_form(self):
+        """First-time construction of the scrollable settings form"""
         # Create a scrollable frame
         canvas = tb.Canvas(self.frame)
         scrollbar = tb.Scrollbar(self.frame, orient="vertical", command=canvas.yview)
@@ -738,168 +1041,231 @@ API Configuration Help:
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
         row = 0
-        config_fields = self.palworld_config_manager.get_config_fields()
-        
+        palworld_settings = self.settings.get("PalWorldSettings", {})
+
         # Debug: Print what we're looking for vs what we have
-        self.log(f"🔍 Looking for fields in: {list(config_fields['PalWorldSettings'].keys())}")
-        if "PalWorldSettings" in self.settings:
-            self.log(f"📄 Found in file: {list(self.settings['PalWorldSettings'].keys())}")
-        
-        # Define section groupings
-        sections = {
-            "Server Settings": ["ServerName", "ServerDescription", "AdminPassword", "ServerPassword", 
-                              "ServerPlayerMaxNum", "PublicIP", "PublicPort"],
-            "Game Balance": ["Difficulty", "DayTimeSpeedRate", "NightTimeSpeedRate", "ExpRate", 
-                           "DeathPenalty", "GuildPlayerMaxNum"],
-            "Pal Settings": ["PalCaptureRate", "PalSpawnNumRate", "PalDamageRateAttack", "PalDamageRateDefense",
-                           "PalStaminaDecreaceRate", "PalStomachDecreaceRate", "PalAutoHPRegeneRate",
-                           "PalAutoHpRegeneRateInSleep", "PalEggDefaultHatchingTime"],
-            "Player Settings": ["PlayerDamageRateAttack", "PlayerDamageRateDefense", "PlayerStaminaDecreaceRate",
-                              "PlayerStomachDecreaceRate", "PlayerAutoHPRegeneRate", "PlayerAutoHpRegeneRateInSleep"],
-            "Base Camp": ["BaseCampMaxNumInGuild", "BaseCampWorkerMaxNum"],
-            "Building": ["BuildObjectDamageRate", "BuildObjectDeteriorationDamageRate", "MaxBuildingLimitNum"],
-            "Collection": ["CollectionDropRate", "CollectionObjectHpRate", "CollectionObjectRespawnSpeedRate"],
-            "Enemy & Items": ["EnemyDropItemRate", "ItemWeightRate", "EquipmentDurabilityDamageRate"],
-            "Gameplay Features": ["bEnableFastTravel", "bEnableInvaderEnemy", "bHardcore", "bPalLost", 
-                                "bShowPlayerList", "bCharacterRecreateInHardcore", "bInvisibleOtherGuildBaseCampAreaFX",
-                                "bIsRandomizerPalLevelRandom", "bIsUseBackupSaveData", "bBuildAreaLimit",
-                                "bAllowGlobalPalboxExport", "bAllowGlobalPalboxImport"],
-            "Randomizer": ["RandomizerSeed", "RandomizerType"],
-            "Crossplay": ["CrossplayPlatforms", "AllowConnectPlatform"],
-            "Chat & Supply": ["ChatPostLimitPerMinute", "SupplyDropSpan"],
-            "Sync Settings": ["ServerReplicatePawnCullDistance", "ItemContainerForceMarkDirtyInterval"],
-            "API & Logging": ["RESTAPIEnabled", "RESTAPIPort", "RCONEnabled", "RCONPort", "LogFormatType"]
-        }
-        
-        for section_name, field_names in sections.items():
+        if self.debug_enabled:
+            config_fields = self.palworld_config_manager.get_config_fields()
+            self.log(f"🔍 Looking for fields in: {list(config_fields['PalWorldSettings'].keys())}")
+            if "PalWorldSettings" in self.settings:
+                self.log(f"📄 Found in file: {list(self.settings['PalWorldSettings'].keys())}")
+
+        for section_name, field_rows in SECTION_SCHEMA:
             # Create section header with toggle functionality
             section_frame = tb.LabelFrame(scrollable_frame, text=section_name, padding=5)
             section_frame.grid(row=row, column=0, sticky="ew", padx=5, pady=2)
             row += 1
-            
+
             section_row = 0
-            for field_name in field_names:
-                if field_name in config_fields["PalWorldSettings"]:
-                    value_type = config_fields["PalWorldSettings"][field_name]
-                    default_value = self.settings.get("PalWorldSettings", {}).get(field_name, "")
-                    
-                    # Debug: Print field value
+            for field_name, widget_kind, choices in field_rows:
+                default_value = palworld_settings.get(field_name, "")
+
+                # Debug: Print field value
+                if self.debug_enabled:
                     self.log(f"📝 Field {field_name}: '{default_value}'")
-                    
-                    # Create label and input widget
-                    tb.Label(section_frame, text=field_name, width=25, anchor="w").grid(row=section_row, column=0, sticky="w", padx=5)
-                    
-                    if isinstance(value_type, list):  # dropdown
-                        var = tb.StringVar(value=default_value)
-                        widget = tb.Combobox(section_frame, textvariable=var, values=value_type, state="readonly", width=30)
-                    elif value_type == bool:
-                        var = tb.BooleanVar(value=default_value.lower() == "true")
-                        widget = tb.Checkbutton(section_frame, variable=var)
-                    else:
-                        var = tb.StringVar(value=default_value)
-                        widget = tb.Entry(section_frame, textvariable=var, width=30)
 
-                    widget.grid(row=section_row, column=1, sticky="w", padx=5, pady=2)
-                    self.inputs[("PalWorldSettings", field_name)] = var
-                    section_row += 1
+                # Create label and input widget
+                tb.Label(section_frame, text=field_name, width=25, anchor="w").grid(row=section_row, column=0, sticky="w", padx=5)
+
+                if widget_kind == _W_DROPDOWN:
+                    var = tb.StringVar(value=default_value)
+                    widget = tb.Combobox(section_frame, textvariable=var, values=choices, state="readonly", width=30)
+                elif widget_kind == _W_CHECK:
+                    var = tb.BooleanVar(value=default_value.lower() == "true")
+                    widget = tb.Checkbutton(section_frame, variable=var)
+                else:
+                    var = tb.StringVar(value=default_value)
+                    widget = tb.Entry(section_frame, textvariable=var, width=30)
+
+                widget.grid(row=section_row, column=1, sticky="w", padx=5, pady=2)
+                self.inputs[("PalWorldSettings", field_name)] = var
+                section_row += 1
 
         # Configure grid weights
         scrollable_frame.grid_columnconfigure(0, weight=1)
+        self._settings_form_built = True
 
     def save_and_upload(self):
-        """Save configuration and upload to server"""
-        # Save to local file
+        """Save configuration locally and upload it off the Tk main thread"""
+        # Save to local file; Tk variables must be read on the Tk thread
         local_path = self.config_manager.get_config("LOCAL_CONFIG_PATH")
-        settings = {}
-        
+        settings = defaultdict(dict)
+        _str = str
+
         for (section, key), var in self.inputs.items():
-            if section not in settings:
-                settings[section] = {}
-            settings[section][key] = str(var.get())
-            
-        self.palworld_config_manager.save_palworld_config(local_path, settings)
-        
-        # Upload to server
-        self.upload_config()
+            settings[section][key] = _str(var.get())
+
+        # Skip the file write and the SFTP round-trip when nothing changed
+        # since the last save
+        state_hash = hash(frozenset(
+            (section, key, value)
+            for section, fields in settings.items()
+            for key, value in fields.items()
+        ))
+        if state_hash == self._last_saved_hash:
+            self.status.set("✅ No changes to save.")
+            self.log("✅ No settings changed; skipping save and upload.")
+            return
+
+        self.palworld_config_manager.save_palworld_config(local_path, dict(settings))
+
+        # Upload on the worker pipeline like _download_config: the pscp
+        # fallback may legitimately run for minutes on a slow link, and the
+        # Save button must not freeze the mainloop for that long
+        self.run_async(self._save_and_upload(state_hash))
+
+    async def _save_and_upload(self, state_hash):
+        """Coroutine driving the config upload off the Tk main thread.
+
+        Only a confirmed upload marks this state as saved — after a
+        transient SSH failure the next Save click must retry the transfer
+        instead of short-circuiting on the hash.
+        """
+        if await self.run_in_executor(self.upload_config):
+            self._last_saved_hash = state_hash
 
     def run_steamcmd_update(self):
         """Run SteamCMD update"""
         if not self.ssh_manager:
             self.log("❌ SSH manager not initialized. Please configure PuTTY paths.")
             return
-            
-        def run_update():
-            self.log("🚀 Running SteamCMD update...")
-            steamcmd_cmd = 'bash -c "steamcmd +login anonymous +app_update 2394010 validate +quit"'
-            
-            # Type assertion to help linter
-            ssh_manager = self.ssh_manager
-            assert ssh_manager is not None
-            stdout, stderr = ssh_manager.execute_command(steamcmd_cmd)
-            
-            if stdout:
-                for line in stdout.split('\n'):
-                    if line.strip():
-                        self.log(line.strip())
-                self.log("✅ SteamCMD update complete.")
-            else:
-                self.log(f"❌ SteamCMD error: {stderr}")
 
-        threading.Thread(target=run_update).start()
+        self.run_async(self._run_steamcmd_update())
+
+    async def _run_steamcmd_update(self):
+        """Stream SteamCMD output into the console line by line.
+
+        The previous implementation buffered the whole multi-megabyte log
+        in memory and split it at the end; streaming keeps one line in
+        memory and shows progress as it happens.
+        """
+        self.log("🚀 Running SteamCMD update...")
+        steamcmd_cmd = 'bash -c "steamcmd +login anonymous +app_update 2394010 validate +quit"'
+        ssh_manager = self.ssh_manager
+        assert ssh_manager is not None
+        saw_output = False
+        try:
+            async for line in ssh_manager.stream_command(steamcmd_cmd):
+                line = line.strip()
+                if line:
+                    saw_output = True
+                    self.log(line)
+        except Exception as e:
+            self.log(f"❌ SteamCMD error: {str(e)}")
+            return
+        if saw_output:
+            self.log("✅ SteamCMD update complete.")
+        else:
+            self.log("❌ SteamCMD error: no output received")
 
     def refresh_server_info(self):
         """Get server information"""
         if not self.api_manager:
             self.log("❌ API manager not initialized. Please configure API settings.")
             return
-            
-        def fetch_info():
-            self.log("🔄 Fetching server information...")
-            # Type assertion to help linter
-            api_manager = self.api_manager
-            assert api_manager is not None
-            info = api_manager.get_server_info()
-            if info:
-                self.server_info_text.config(state="normal")
-                self.server_info_text.delete(1.0, tb.END)
-                self.server_info_text.insert(tb.END, json.dumps(info, indent=2))
-                self.server_info_text.config(state="disabled")
-                self.log("✅ Server info updated")
-            else:
-                self.log("❌ Failed to fetch server info")
+        if self.root.state() == "iconic":
+            # Nobody is looking; skip the refresh entirely
+            return
 
-        threading.Thread(target=fetch_info).start()
+        self._submit(self._fetch_info)
+
+    def _fetch_info(self):
+        """Fetch and display server info (runs on a worker)"""
+        self.log("🔄 Fetching server information...")
+        # Type assertion to help linter
+        api_manager = self.api_manager
+        assert api_manager is not None
+        info = self._cached_api("server_info", api_manager.get_server_info)
+        if info:
+            pretty = json.dumps(info, indent=2, ensure_ascii=False)
+
+            def show():
+                # The info box only exists once the API Control tab has been
+                # built; auto-refresh may run before the user visits it
+                text = getattr(self, "server_info_text", None)
+                if text is None:
+                    return
+                text.config(state="normal")
+                text.delete(1.0, tb.END)
+                text.insert(tb.END, pretty)
+                text.config(state="disabled")
+            self._ui(show)
+            self.log("✅ Server info updated")
+        else:
+            self.log("❌ Failed to fetch server info")
+
+    async def _refresh_dashboard(self):
+        """Fetch server info and the player list concurrently.
+
+        The two HTTP requests run side by side on the worker pool and the
+        coroutine completes only when both have landed, so callers (the
+        auto-refresh loop) get natural backpressure instead of stacking
+        fetches when the server is slow.
+        """
+        await asyncio.gather(
+            self.run_in_executor(self._fetch_info),
+            self.run_in_executor(self._fetch_players),
+        )
 
     def refresh_players(self):
         """Get player list"""
         if not self.api_manager:
             self.log("❌ API manager not initialized. Please configure API settings.")
             return
-            
-        def fetch_players():
-            self.log("🔄 Fetching player list...")
-            # Type assertion to help linter
-            api_manager = self.api_manager
-            assert api_manager is not None
-            players = api_manager.get_players()
-            if players:
-                self.player_listbox.delete(0, tb.END)
-                
-                for player in players:
-                    if isinstance(player, dict):
-                        name = player.get('name', 'Unknown')
-                        playeruid = player.get('playeruid', 'N/A')
-                        self.player_listbox.insert(tb.END, f"{name} ({playeruid})")
-                    elif isinstance(player, str):
-                        self.player_listbox.insert(tb.END, f"{player} (N/A)")
-                    else:
-                        self.player_listbox.insert(tb.END, f"{str(player)} (N/A)")
-                
-                self.log(f"✅ Found {len(players)} players")
-            else:
-                self.log("❌ Failed to fetch players")
+        if self.root.state() == "iconic":
+            return
 
-        threading.Thread(target=fetch_players).start()
+        self._submit(self._fetch_players)
+
+    def _fetch_players(self):
+        """Fetch and display the player list (runs on a worker)"""
+        self.log("🔄 Fetching player list...")
+        # Type assertion to help linter
+        api_manager = self.api_manager
+        assert api_manager is not None
+        players = self._cached_api("players", api_manager.get_players)
+        if players:
+            # Parsed names kept in parallel with the listbox rows so the
+            # kick/ban/teleport handlers never re-split display strings
+            items = []
+            names = []
+            for player in players:
+                if isinstance(player, dict):
+                    name = player.get('name', 'Unknown')
+                    playeruid = player.get('playeruid', 'N/A')
+                    items.append(f"{name} ({playeruid})")
+                elif isinstance(player, str):
+                    name = player
+                    items.append(f"{player} (N/A)")
+                else:
+                    name = str(player)
+                    items.append(f"{name} (N/A)")
+                names.append(name)
+
+            # One variadic insert instead of a Tcl round-trip per player
+            def show():
+                self._player_names = names
+                # The listbox only exists once the API Control tab has been
+                # built; auto-refresh may run before the user visits it
+                listbox = getattr(self, "player_listbox", None)
+                if listbox is None:
+                    return
+                listbox.delete(0, tb.END)
+                listbox.insert(tb.END, *items)
+            self._ui(show)
+
+            self.log(f"✅ Found {len(players)} players")
+        else:
+            self.log("❌ Failed to fetch players")
+
+    def _selected_player_name(self, index):
+        """Name of the player at a listbox row, parsed once at refresh time"""
+        if index < len(self._player_names):
+            return self._player_names[index]
+        # Fallback for rows that predate the parallel names list; partition
+        # handles a missing separator without the substring pre-check
+        entry = self.player_listbox.get(index)
+        return entry.partition(" (")[0] or entry
 
     def kick_selected_player(self):
         """Kick selected player"""
@@ -912,11 +1278,7 @@ API Configuration Help:
             messagebox.showwarning("Warning", "Please select a player to kick")
             return
         
-        player_entry = self.player_listbox.get(selection[0])
-        if " (" in player_entry:
-            player_name = player_entry.split(" (")[0]
-        else:
-            player_name = player_entry
+        player_name = self._selected_player_name(selection[0])
             
         if messagebox.askyesno("Confirm Kick", f"Are you sure you want to kick {player_name}?"):
             # Type assertion to help linter
@@ -925,6 +1287,8 @@ API Configuration Help:
             success = api_manager.kick_player(player_name)
             if success:
                 self.log(f"✅ Kicked player: {player_name}")
+                # The cached list is stale after a mutation
+                self._api_cache.pop("players", None)
                 self.refresh_players()
             else:
                 self.log(f"❌ Failed to kick player: {player_name}")
@@ -940,11 +1304,7 @@ API Configuration Help:
             messagebox.showwarning("Warning", "Please select a player to ban")
             return
         
-        player_entry = self.player_listbox.get(selection[0])
-        if " (" in player_entry:
-            player_name = player_entry.split(" (")[0]
-        else:
-            player_name = player_entry
+        player_name = self._selected_player_name(selection[0])
             
         if messagebox.askyesno("Confirm Ban", f"Are you sure you want to ban {player_name}?"):
             # Type assertion to help linter
@@ -953,6 +1313,7 @@ API Configuration Help:
             success = api_manager.ban_player(player_name)
             if success:
                 self.log(f"✅ Banned player: {player_name}")
+                self._api_cache.pop("players", None)
                 self.refresh_players()
             else:
                 self.log(f"❌ Failed to ban player: {player_name}")
@@ -968,11 +1329,7 @@ API Configuration Help:
             messagebox.showwarning("Warning", "Please select a player to teleport")
             return
         
-        player_entry = self.player_listbox.get(selection[0])
-        if " (" in player_entry:
-            player_name = player_entry.split(" (")[0]
-        else:
-            player_name = player_entry
+        player_name = self._selected_player_name(selection[0])
         
         # Create teleport dialog
         dialog = tb.Toplevel(self.root)
@@ -1060,41 +1417,73 @@ API Configuration Help:
 
     def toggle_auto_refresh(self):
         """Toggle auto-refresh functionality"""
+        # Always cancel any pending timer/task first so rapid toggling can
+        # never stack multiple refresh chains (each issuing its own calls)
+        if self.auto_refresh_job is not None:
+            self.root.after_cancel(self.auto_refresh_job)
+            self.auto_refresh_job = None
+        if self._auto_refresh_task is not None:
+            self._auto_refresh_task.cancel()
+            self._auto_refresh_task = None
         if self.auto_refresh_var.get():
-            self.schedule_auto_refresh()
-        else:
-            if hasattr(self, 'auto_refresh_job'):
-                self.root.after_cancel(self.auto_refresh_job)
+            if self.ssh_manager and self.server_manager:
+                # Subscribe to pushed status over the shared SSH channel:
+                # one handshake for the whole subscription instead of one
+                # per 30-second poll
+                self._auto_refresh_task = self.run_async(self._auto_refresh_loop())
+            else:
+                self.schedule_auto_refresh()
+
+    async def _auto_refresh_loop(self):
+        """Receive server status pushed by a remote loop and refresh API data per tick"""
+        ssh_manager = self.ssh_manager
+        server_manager = self.server_manager
+        assert ssh_manager is not None and server_manager is not None
+        session = server_manager.screen_session_name
+        cmd = f"while :; do screen -list 2>/dev/null | grep {session} || echo __STOPPED__; echo __TICK__; sleep 30; done"
+        status_lines = []
+        try:
+            async for line in ssh_manager.stream_command(cmd):
+                if line == "__TICK__":
+                    if status_lines and "__STOPPED__" not in status_lines:
+                        text = " ".join(l.strip() for l in status_lines)
+                        self._ui(self.server_status_label.config,
+                                 text=f"✅ Server is running in screen session: {text}", foreground="green")
+                    else:
+                        self._ui(self.server_status_label.config,
+                                 text="❌ Server is not running", foreground="red")
+                    status_lines = []
+                    if self.api_manager and self.root.state() != "iconic":
+                        await self._refresh_dashboard()
+                else:
+                    status_lines.append(line)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Connection dropped or widgets destroyed; subscription ends
+            pass
 
     def schedule_auto_refresh(self):
-        """Schedule next auto-refresh"""
+        """Schedule next auto-refresh (timer fallback when SSH is unavailable)"""
         if self.auto_refresh_var.get():
             self.refresh_server_info()
             self.refresh_players()
             self.auto_refresh_job = self.root.after(30000, self.schedule_auto_refresh)  # 30 seconds
+        else:
+            self.auto_refresh_job = None
 
     def test_scp_connection(self):
-        """Test SFTP connection to the server by downloading a small temp file using PSCP"""
+        """Test SFTP connection to the server with a single remote stat"""
         if not self.ssh_manager:
             self.log("❌ SSH manager not initialized. Please configure PuTTY paths.")
             return
-        
+
         try:
-            self.log("🔍 Testing SFTP connection by downloading a temp file...")
-            temp_remote = "/tmp/palworld_sftp_test.txt"
-            temp_local = "palworld_sftp_test.txt"
-            # Create a temp file on the server
-            stdout, stderr = self.ssh_manager.execute_command(f"echo 'SFTP test' > {temp_remote}")
-            # Try to download the temp file
-            success, message = self.ssh_manager.download_file(temp_remote, temp_local)
+            self.log("🔍 Testing SFTP connection...")
+            success, message = self.ssh_manager.test_sftp_connection()
             if success:
-                self.log("✅ SFTP connection test successful (file downloaded)")
+                self.log("✅ SFTP connection test successful")
                 self.status.set("✅ SFTP connection test successful")
-                # Clean up local temp file
-                try:
-                    os.remove(temp_local)
-                except Exception:
-                    pass
             else:
                 self.log(f"❌ SFTP connection failed: {message}")
                 self.status.set(f"❌ SFTP connection failed: {message}")
@@ -1118,71 +1507,28 @@ API Configuration Help:
             else:
                 self.log("❌ Config file not found in any common locations")
                 if messagebox.askyesno("Config Not Found", "Config file not found. Do you want to create it?"):
-                    remote_path = self.config_manager.get_config("REMOTE_CONFIG_PATH")
-                    default_path = "~/Steam/steamapps/common/PalServer/DefaultPalWorldSettings.ini"
                     ssh_manager = self.ssh_manager
-                    # Get the full absolute path of ~/Steam/steamapps/common/PalServer/Pal
+                    default_path = "~/Steam/steamapps/common/PalServer/DefaultPalWorldSettings.ini"
                     pal_dir = "~/Steam/steamapps/common/PalServer/Pal"
-                    full_pal_dir, _ = ssh_manager.get_full_path(pal_dir)
-                    full_default_path, _ = ssh_manager.get_full_path(default_path)
-                    if not full_pal_dir or not full_default_path:
-                        self.log(f"❌ Could not resolve full path for {pal_dir} or default config.")
-                        while messagebox.askretrycancel("Error", f"Could not resolve full path for {pal_dir} or default config. Retry?"):
-                            full_pal_dir, _ = ssh_manager.get_full_path(pal_dir)
-                            full_default_path, _ = ssh_manager.get_full_path(default_path)
-                            if full_pal_dir and full_default_path:
-                                break
-                        else:
-                            return
-                        full_pal_dir = full_pal_dir.strip()
-                        full_default_path = full_default_path.strip()
-                    else:
-                        full_pal_dir = full_pal_dir.strip()
-                        full_default_path = full_default_path.strip()
-                    # Create the folders using the absolute path
+                    # Resolve paths, create the directories, copy the default
+                    # config and verify it in one SSH round-trip; each && step
+                    # aborts the script on failure so stderr explains what broke
+                    create_cmd = (
+                        f'dir=$(readlink -f {pal_dir}) && def=$(readlink -f {default_path}) && '
+                        f'target="$dir/Saved/Config/LinuxServer/PalWorldSettings.ini" && '
+                        f'mkdir -p "$dir/Saved/Config/LinuxServer" && '
+                        f'cp "$def" "$target" && [ -f "$target" ] && echo "OK $target"'
+                    )
                     while True:
-                        create_dirs_cmd = f"mkdir -p '{full_pal_dir}/Saved/Config/LinuxServer'"
-                        stdout, stderr = ssh_manager.execute_command(create_dirs_cmd)
-                        self.log(f"[DEBUG] mkdir stdout: {stdout}")
-                        self.log(f"[DEBUG] mkdir stderr: {stderr}")
-                        if stderr:
-                            self.log(f"❌ Failed to create directories: {stderr}")
-                            if not messagebox.askretrycancel("Error", f"Failed to create directories: {stderr}\nRetry?"):
-                                return
-                        else:
+                        stdout, stderr = ssh_manager.execute_command(create_cmd)
+                        result = (stdout or "").strip()
+                        if result.startswith("OK "):
+                            full_target_path = result[3:].strip()
                             break
-                    # Copy the default config to the new location using the absolute path
-                    full_target_path = f"{full_pal_dir}/Saved/Config/LinuxServer/PalWorldSettings.ini"
-                    while True:
-                        copy_cmd = f"cp '{full_default_path}' '{full_target_path}'"
-                        stdout, stderr = ssh_manager.execute_command(copy_cmd)
-                        if stderr:
-                            self.log(f"❌ Failed to copy default config: {stderr}")
-                            if not messagebox.askretrycancel("Error", f"Failed to copy default config: {stderr}\nRetry?"):
-                                return
-                        else:
-                            break
-                    self.log(f"✅ Default config copied to {full_target_path}")
-                    # Check if the file now exists
-                    file_exists, _ = ssh_manager.test_file_exists(full_target_path)
-                    if not file_exists:
-                        self.log(f"❌ Default config was not properly copied to {full_target_path}")
-                        if not messagebox.askretrycancel("Copy Failed", f"Default config was not properly copied to {full_target_path}\nRetry?"):
-                            return
-                        # If retry, go back to copy step
-                        while True:
-                            copy_cmd = f"cp '{full_default_path}' '{full_target_path}'"
-                            stdout, stderr = ssh_manager.execute_command(copy_cmd)
-                            if stderr:
-                                self.log(f"❌ Failed to copy default config: {stderr}")
-                                if not messagebox.askretrycancel("Error", f"Failed to copy default config: {stderr}\nRetry?"):
-                                    return
-                            else:
-                                break
-                        file_exists, _ = ssh_manager.test_file_exists(full_target_path)
-                        if not file_exists:
-                            self.log(f"❌ Default config was not properly copied to {full_target_path} (after retry)")
+                        self.log(f"❌ Failed to create default config: {stderr or result}")
+                        if not messagebox.askretrycancel("Error", f"Failed to create default config: {stderr or result}\nRetry?"):
                             return
+                    self.log(f"✅ Default config copied to {full_target_path}")
                     if messagebox.askyesno("Default Config Created", f"Default config created at:\n{full_target_path}\n\nUpdate the path in config.py?"):
                         self.update_config_path(full_target_path)
                 else:
@@ -1221,10 +1567,10 @@ API Configuration Help:
             stdout, stderr = ssh_manager.list_steam_config_files()
             
             if stdout:
-                self.log("📁 Steam config files:")
-                for line in stdout.strip().split('\n'):
-                    if line.strip():
-                        self.log(f"   {line}")
+                # One log call (and one widget insert at flush time) for the
+                # whole listing instead of one per file
+                lines = [f"   {line}" for line in stdout.strip().split('\n') if line.strip()]
+                self.log("📁 Steam config files:\n" + "\n".join(lines))
             else:
                 self.log("❌ No Steam config files found")
                 
@@ -1232,25 +1578,41 @@ API Configuration Help:
             self.log(f"❌ Error: {str(e)}")
             self.status.set(f"❌ Error: {str(e)}")
 
-    def refresh_server_status(self):
-        """Refresh server status"""
+    def _get_status(self, ttl_ms=5000):
+        """Server status with bounded staleness; ttl_ms=0 forces a fresh poll"""
+        cache = self._status_cache
+        if cache["value"] is not None and (time.monotonic() - cache["fetchedAt"]) * 1000 < ttl_ms:
+            return cache["value"]
+        server_manager = self.server_manager
+        assert server_manager is not None
+        value = server_manager.get_server_status()
+        # Stamp after the query returns so a slow poll doesn't overstate
+        # the snapshot's freshness
+        cache["fetchedAt"] = time.monotonic()
+        cache["value"] = value
+        return value
+
+    def refresh_server_status(self, ttl_ms=0):
+        """Refresh server status.
+
+        Explicit refreshes (buttons, post start/stop) default to ttl_ms=0
+        for a fresh poll; burst callers can pass a TTL to reuse the last
+        snapshot instead of stacking SSH round-trips.
+        """
         if not self.server_manager:
             self.log("❌ Server manager not initialized. Please configure server settings.")
             return
-            
+
         def update_status():
-            # Type assertion to help linter
-            server_manager = self.server_manager
-            assert server_manager is not None
-            running, message = server_manager.get_server_status()
+            running, message = self._get_status(ttl_ms)
             def update_label():
                 if running:
                     self.server_status_label.config(text=f"✅ {message}", foreground="green")
                 else:
                     self.server_status_label.config(text=f"❌ {message}", foreground="red")
-            self.server_status_label.after(0, update_label)
+            self.server_status_label.after_idle(update_label)
         
-        threading.Thread(target=update_status).start()
+        self._submit(update_status)
 
     def get_server_logs(self):
         """Get server logs"""
@@ -1265,16 +1627,30 @@ API Configuration Help:
             logs, error = server_manager.get_server_logs()
             def update_logs():
                 if logs:
+                    digest = hashlib.blake2b(logs.encode(), digest_size=8).digest()
+                    if digest == self._last_logs_hash:
+                        # Identical to the last poll; skip the repaint
+                        self.log("✅ Server logs unchanged")
+                        return
+                    prev = self._last_logs_text
                     self.server_logs_text.config(state="normal")
-                    self.server_logs_text.delete(1.0, tb.END)
-                    self.server_logs_text.insert(tb.END, logs)
+                    if prev and logs.startswith(prev):
+                        # Logs only grew: append the suffix instead of
+                        # re-rendering the whole widget
+                        self.server_logs_text.insert(tb.END, logs[len(prev):])
+                    else:
+                        self.server_logs_text.delete(1.0, tb.END)
+                        self.server_logs_text.insert(tb.END, logs)
+                    self._trim_text_widget(self.server_logs_text)
                     self.server_logs_text.config(state="disabled")
+                    self._last_logs_hash = digest
+                    self._last_logs_text = logs
                     self.log("✅ Server logs updated")
                 else:
                     self.log(f"❌ Failed to get logs: {error}")
-            self.server_logs_text.after(0, update_logs)
+            self.server_logs_text.after_idle(update_logs)
         
-        threading.Thread(target=fetch_logs).start()
+        self._submit(fetch_logs)
 
     def start_server(self):
         """Start the server"""
@@ -1282,19 +1658,20 @@ API Configuration Help:
             self.log("❌ Server manager not initialized. Please configure server settings.")
             return
             
-        if messagebox.askyesno("Confirm Start", "Are you sure you want to start the server?"):
-            def start():
-                # Type assertion to help linter
-                server_manager = self.server_manager
-                assert server_manager is not None
-                success, message = server_manager.start_server(self.port_var.get())
-                if success:
-                    self.log("✅ Server started successfully")
-                    self.refresh_server_status()
-                else:
-                    self.log(f"❌ Failed to start server: {message}")
-            
-            threading.Thread(target=start).start()
+        self.run_async(self._start_server(self.port_var.get()))
+
+    async def _start_server(self, port):
+        """Confirm and start the server off the Tk main thread"""
+        if not await self._confirm("Confirm Start", "Are you sure you want to start the server?"):
+            return
+        server_manager = self.server_manager
+        assert server_manager is not None
+        success, message = await self.run_in_executor(server_manager.start_server, port)
+        if success:
+            self.log("✅ Server started successfully")
+            self.refresh_server_status()
+        else:
+            self.log(f"❌ Failed to start server: {message}")
 
     def stop_server(self):
         """Stop the server"""
@@ -1302,19 +1679,20 @@ API Configuration Help:
             self.log("❌ Server manager not initialized. Please configure server settings.")
             return
             
-        if messagebox.askyesno("Confirm Stop", "Are you sure you want to stop the server?"):
-            def stop():
-                # Type assertion to help linter
-                server_manager = self.server_manager
-                assert server_manager is not None
-                success, message = server_manager.stop_server()
-                if success:
-                    self.log("✅ Server stopped successfully")
-                    self.refresh_server_status()
-                else:
-                    self.log(f"❌ Failed to stop server: {message}")
-            
-            threading.Thread(target=stop).start()
+        self.run_async(self._stop_server())
+
+    async def _stop_server(self):
+        """Confirm and stop the server off the Tk main thread"""
+        if not await self._confirm("Confirm Stop", "Are you sure you want to stop the server?"):
+            return
+        server_manager = self.server_manager
+        assert server_manager is not None
+        success, message = await self.run_in_executor(server_manager.stop_server)
+        if success:
+            self.log("✅ Server stopped successfully")
+            self.refresh_server_status()
+        else:
+            self.log(f"❌ Failed to stop server: {message}")
 
     def restart_server(self):
         """Restart the server"""
@@ -1322,19 +1700,20 @@ API Configuration Help:
             self.log("❌ Server manager not initialized. Please configure server settings.")
             return
             
-        if messagebox.askyesno("Confirm Restart", "Are you sure you want to restart the server?"):
-            def restart():
-                # Type assertion to help linter
-                server_manager = self.server_manager
-                assert server_manager is not None
-                success, message = server_manager.restart_server(self.port_var.get())
-                if success:
-                    self.log("✅ Server restarted successfully")
-                    self.refresh_server_status()
-                else:
-                    self.log(f"❌ Failed to restart server: {message}")
-            
-            threading.Thread(target=restart).start()
+        self.run_async(self._restart_server(self.port_var.get()))
+
+    async def _restart_server(self, port):
+        """Confirm and restart the server off the Tk main thread"""
+        if not await self._confirm("Confirm Restart", "Are you sure you want to restart the server?"):
+            return
+        server_manager = self.server_manager
+        assert server_manager is not None
+        success, message = await self.run_in_executor(server_manager.restart_server, port)
+        if success:
+            self.log("✅ Server restarted successfully")
+            self.refresh_server_status()
+        else:
+            self.log(f"❌ Failed to restart server: {message}")
 
     def update_server(self):
         """Update the server"""
@@ -1342,18 +1721,19 @@ API Configuration Help:
             self.log("❌ Server manager not initialized. Please configure server settings.")
             return
             
-        if messagebox.askyesno("Confirm Update", "Are you sure you want to update the server?"):
-            def update():
-                # Type assertion to help linter
-                server_manager = self.server_manager
-                assert server_manager is not None
-                success, message = server_manager.update_server()
-                if success:
-                    self.log("✅ Server updated successfully")
-                else:
-                    self.log(f"❌ Failed to update server: {message}")
-            
-            threading.Thread(target=update).start()
+        self.run_async(self._update_server())
+
+    async def _update_server(self):
+        """Confirm and update the server off the Tk main thread"""
+        if not await self._confirm("Confirm Update", "Are you sure you want to update the server?"):
+            return
+        server_manager = self.server_manager
+        assert server_manager is not None
+        success, message = await self.run_in_executor(server_manager.update_server)
+        if success:
+            self.log("✅ Server updated successfully")
+        else:
+            self.log(f"❌ Failed to update server: {message}")
 
     def backup_and_download_saved(self):
         """Backup and download the Palworld Saved folder from the VPS"""
@@ -1375,17 +1755,23 @@ API Configuration Help:
                     self.log(f"❌ {message}")
                     self.status.set(f"❌ Backup failed: {message}")
                     messagebox.showerror("Backup Failed", message)
-            self.server_status_label.after(0, update_backup_status)
+            self.server_status_label.after_idle(update_backup_status)
         
-        threading.Thread(target=do_backup).start()
+        self._submit(do_backup)
 
     def show_tab(self, idx):
-        # Hide all frames
-        for i, (icon, text, frame) in enumerate(self.tabs):
-            frame.lower()
+        icon, text, setup_fn, frame = self.tabs[idx]
+        # Build the tab on first visit
+        if frame is None:
+            frame = setup_fn()
+            self.tabs[idx] = (icon, text, setup_fn, frame)
+        # Unmap the other frames so the geometry manager only lays out the
+        # visible tab on resizes, instead of all five stacked frames
+        for _, _, _, f in self.tabs:
+            if f is not None and f is not frame:
+                f.pack_forget()
         # Show selected frame
-        icon, text, frame = self.tabs[idx]
-        frame.lift()
+        frame.pack(fill="both", expand=True)
         # Highlight the active tab button
         for i, btn in enumerate(self.tab_buttons):
             btn.config(bootstyle="primary" if i == idx else "secondary")
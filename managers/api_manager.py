@@ -1,14 +1,51 @@
 import requests
-import json
+import logging
+import threading
+import time
 import base64
+from requests.adapters import HTTPAdapter, Retry
 from typing import Optional, Dict, Any, List, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # optional dependency, stdlib json works fine too
+    orjson = None
+
+log = logging.getLogger(__name__)
+
 class PalworldAPIManager:
     def __init__(self, api_base: str, username: str, password: str):
         self.api_base = api_base
         self.username = username
         self.password = password
-        
+
+        # Persistent session so back-to-back calls reuse one TCP connection
+        # (keep-alive) instead of paying a fresh handshake per request.
+        # The adapter keeps a small socket pool and retries transient
+        # gateway errors with a short backoff. pool_block makes bursts wait
+        # for a free socket instead of opening extras and discarding them.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            pool_block=True,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept"] = "application/json"
+
+        # Backpressure for callers: at most 4 in-flight requests, matching
+        # the socket pool, so batch moderation never floods the server
+        self._request_gate = threading.BoundedSemaphore(4)
+
+        # Base64 of the credentials changes only when they do
+        self._auth_header = self._create_auth_header()
+
+        # endpoint -> (monotonic timestamp, response) for the hot read
+        # endpoints; entries are only honored when a caller asks for a TTL
+        self._cache = {}
+
         # API endpoints
         self.endpoints = {
             "info": "/v1/api/info",
@@ -32,51 +69,72 @@ class PalworldAPIManager:
         try:
             url = f"{self.api_base}{endpoint}"
             
+            # Accept is preset on the session
             headers = {
-                "Accept": "application/json",
-                "Authorization": self._create_auth_header()
+                "Authorization": self._auth_header
             }
             
             # Add Content-Type for POST requests
             if method == "POST" and data:
                 headers["Content-Type"] = "application/json"
             
-            if method == "GET":
-                response = requests.get(url, headers=headers, timeout=10)
-            elif method == "POST":
-                response = requests.post(url, json=data, headers=headers, timeout=10)
-            else:
-                return None
-            
-            # Debug: Print response details
-            print(f"API Request: {method} {url}")
-            print(f"Status Code: {response.status_code}")
-            print(f"Response Headers: {dict(response.headers)}")
-            print(f"Response Text: {response.text[:500]}...")  # First 500 chars
+            with self._request_gate:
+                if method == "GET":
+                    response = self.session.get(url, headers=headers, timeout=10)
+                elif method == "POST":
+                    if data and orjson is not None:
+                        # Serialize straight to bytes instead of routing
+                        # through requests' json= / stdlib dumps path
+                        response = self.session.post(url, data=orjson.dumps(data), headers=headers, timeout=10)
+                    else:
+                        response = self.session.post(url, json=data, headers=headers, timeout=10)
+                else:
+                    return None
             
+            # Lazy %-style args: nothing is formatted (or decoded) unless
+            # DEBUG logging is actually enabled
+            log.debug("API request: %s %s -> %s", method, url, response.status_code)
+
             if response.status_code == 200:
                 try:
+                    # orjson parses the raw bytes directly, skipping the
+                    # charset sniff + str decode that response.json() does
+                    if orjson is not None:
+                        return orjson.loads(response.content)
                     return response.json()
-                except json.JSONDecodeError as e:
-                    print(f"JSON Decode Error: {e}")
-                    print(f"Raw Response: {response.text}")
+                except ValueError as e:
+                    log.debug("JSON decode error: %s; raw response: %.500s", e, response.text)
                     return None
             elif response.status_code == 401:
-                print("Authentication failed")
+                log.debug("Authentication failed for %s", url)
                 return None
             else:
-                print(f"HTTP Error: {response.status_code}")
+                log.debug("HTTP error %s: %.500s", response.status_code, response.text)
                 return None
-                
+
         except requests.exceptions.RequestException as e:
-            print(f"Request Exception: {e}")
+            log.debug("Request exception for %s: %s", endpoint, e)
             return None
             
+    def _cached(self, endpoint: str, ttl_ms: int) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Serve a read endpoint from cache while younger than ttl_ms.
+
+        ttl_ms=0 always hits the network. The timestamp is taken after the
+        request returns so slow responses don't count against freshness.
+        """
+        entry = self._cache.get(endpoint)
+        if entry is not None and (time.monotonic() - entry[0]) * 1000 < ttl_ms:
+            return entry[1]
+        value = self._make_request(endpoint)
+        if value is not None:
+            self._cache[endpoint] = (time.monotonic(), value)
+        return value
+
     def test_connection(self) -> Tuple[bool, str]:
         """Test API connection to the server"""
         # First test basic connectivity
         try:
-            response = requests.get(f"{self.api_base}/v1/api/info", timeout=5)
+            response = self.session.get(f"{self.api_base}/v1/api/info", timeout=5)
             if response.status_code == 401:
                 return True, "Server is reachable but requires authentication"
             elif response.status_code == 200:
@@ -86,20 +144,17 @@ class PalworldAPIManager:
         except requests.exceptions.RequestException as e:
             return False, f"Cannot reach server: {str(e)}"
             
-    def get_server_info(self) -> Optional[Dict[str, Any]]:
-        """Get server information"""
-        result = self._make_request(self.endpoints["info"])
+    def get_server_info(self, *, ttl_ms: int = 0) -> Optional[Dict[str, Any]]:
+        """Get server information; polling callers may pass a TTL"""
+        result = self._cached(self.endpoints["info"], ttl_ms)
         if isinstance(result, dict):
             return result
         return None
-        
-    def get_players(self) -> Optional[List[Dict[str, Any]]]:
-        """Get player list"""
-        print("Getting players list...")
-        result = self._make_request(self.endpoints["players"])
-        print(f"Players result type: {type(result)}")
-        print(f"Players result: {result}")
-        
+
+    def get_players(self, *, ttl_ms: int = 0) -> Optional[List[Dict[str, Any]]]:
+        """Get player list; polling callers may pass a TTL"""
+        result = self._cached(self.endpoints["players"], ttl_ms)
+
         if isinstance(result, list):
             return result
         elif isinstance(result, dict) and "players" in result:
@@ -109,19 +164,22 @@ class PalworldAPIManager:
             # Some APIs wrap the players list in a data field
             return result["data"]
         else:
-            print(f"Unexpected players response format: {result}")
+            log.debug("Unexpected players response format: %s", result)
             return None
         
     def kick_player(self, player_uid: str) -> bool:
         """Kick a player"""
         data = {"playeruid": player_uid}
         result = self._make_request(self.endpoints["kick"], method="POST", data=data)
+        # Cached player list is stale after a mutation
+        self._cache.pop(self.endpoints["players"], None)
         return result is not None
-        
+
     def ban_player(self, player_uid: str) -> bool:
         """Ban a player"""
         data = {"playeruid": player_uid}
         result = self._make_request(self.endpoints["ban"], method="POST", data=data)
+        self._cache.pop(self.endpoints["players"], None)
         return result is not None
         
     def teleport_player(self, player_uid: str, x: float, y: float, z: float) -> bool:
@@ -133,6 +191,7 @@ class PalworldAPIManager:
             "z": z
         }
         result = self._make_request(self.endpoints["teleport"], method="POST", data=data)
+        self._cache.pop(self.endpoints["players"], None)
         return result is not None
         
     def save_world(self) -> bool:
@@ -155,6 +214,7 @@ class PalworldAPIManager:
         """Update API credentials"""
         self.username = username
         self.password = password
+        self._auth_header = self._create_auth_header()
         
     def update_api_base(self, api_base: str):
         """Update API base URL"""
@@ -1,4 +1,6 @@
 import os
+import shutil
+import time
 from typing import Optional, Any
 
 class ConfigManager:
@@ -39,25 +41,66 @@ class ConfigManager:
             os.path.expanduser("~\\Downloads\\putty\\pscp.exe"),
         ]
         
+        # Cache invalidation state: config stays in memory and is only
+        # re-read when config.py's mtime actually changes
+        self._config_file = "config.py"
+        self._config_mtime = 0.0
+        self._last_stat = 0.0
+
+        # Resolved executable paths; probing the candidate list stats the
+        # filesystem every call, so keep the winner around
+        self._plink_path: Optional[str] = None
+        self._pscp_path: Optional[str] = None
+
+        # Keys changed since the last save; an empty set means config.py
+        # on disk already matches and a save can be skipped
+        self._dirty = set()
+
         # Load configuration
         self.load_config()
-        
+
     def load_config(self):
         """Load configuration from config.py if it exists"""
         try:
             import config
-            
-            # Update config with values from config.py
-            for key in self.config.keys():
-                if hasattr(config, key):
-                    self.config[key] = getattr(config, key)
-                    
-        except ImportError:
+            import importlib
+
+            # Skip the reparse entirely when the file hasn't changed
+            mtime = os.stat(config.__file__).st_mtime
+            if mtime == self._config_mtime:
+                return
+            importlib.reload(config)
+
+            # Bulk-copy the known keys via set intersection instead of a
+            # hasattr+getattr probe per key
+            attrs = vars(config)
+            for k in self.config.keys() & attrs.keys():
+                self.config[k] = attrs[k]
+
+            self._config_mtime = mtime
+        except (ImportError, OSError):
             # config.py doesn't exist, use defaults
             pass
-            
+
+    def _check_reload(self):
+        """Reload config.py if it changed on disk (re-stat at most every 500 ms)"""
+        now = time.monotonic()
+        if now - self._last_stat < 0.5:
+            return
+        self._last_stat = now
+        try:
+            mtime = os.stat(self._config_file).st_mtime
+        except OSError:
+            return
+        if mtime != self._config_mtime:
+            self.load_config()
+
     def find_executable(self, paths: list, name: str) -> Optional[str]:
-        """Find executable in the given paths"""
+        """Find executable in the given paths (PATH lookup first)"""
+        # shutil.which handles PATH and the .exe suffix in one shot
+        found = shutil.which(name)
+        if found:
+            return found
         for path in paths:
             if os.path.isfile(path):
                 return path
@@ -67,36 +110,67 @@ class ConfigManager:
                 if os.path.isfile(exe_path):
                     return exe_path
         return None
-        
+
     def get_plink_path(self) -> Optional[str]:
-        """Get plink path, auto-detect if not configured"""
+        """Get plink path, auto-detect if not configured (cached)"""
         if self.config["PLINK_PATH"] and os.path.isfile(self.config["PLINK_PATH"]):
             return self.config["PLINK_PATH"]
-        return self.find_executable(self.putty_paths, "plink")
-        
+        if self._plink_path is None or not os.path.isfile(self._plink_path):
+            self._plink_path = self.find_executable(self.putty_paths, "plink")
+        return self._plink_path
+
     def get_pscp_path(self) -> Optional[str]:
-        """Get pscp path, auto-detect if not configured"""
+        """Get pscp path, auto-detect if not configured (cached)"""
         if self.config["PSCP_PATH"] and os.path.isfile(self.config["PSCP_PATH"]):
             return self.config["PSCP_PATH"]
-        return self.find_executable(self.pscp_paths, "pscp")
-        
+        if self._pscp_path is None or not os.path.isfile(self._pscp_path):
+            self._pscp_path = self.find_executable(self.pscp_paths, "pscp")
+        return self._pscp_path
+
     def update_config(self, key: str, value: Any):
         """Update a configuration value"""
+        if self.config.get(key) != value:
+            self._dirty.add(key)
         self.config[key] = value
+        # A new explicit path invalidates the auto-detected one
+        if key == "PLINK_PATH":
+            self._plink_path = None
+        elif key == "PSCP_PATH":
+            self._pscp_path = None
         
     def get_config(self, key: str) -> Any:
         """Get a configuration value"""
+        self._check_reload()
         return self.config.get(key)
-        
+
+    def snapshot(self) -> dict:
+        """Get a copy of the whole configuration in one lookup"""
+        self._check_reload()
+        return self.config.copy()
+
     def save_config_to_file(self, filename: str = "config.py"):
         """Save current configuration to config.py"""
-        config_content = "# Palworld Server Manager Configuration\n\n"
-        
+        # Nothing changed since the last save: skip the rewrite so file
+        # watchers (and our own mtime check) see no spurious update
+        if not self._dirty and os.path.isfile(filename):
+            return
+
+        lines = ["# Palworld Server Manager Configuration", ""]
+
         for key, value in self.config.items():
-            if isinstance(value, str):
-                config_content += f'{key} = "{value}"\n'
+            if isinstance(value, str) or value is None:
+                # repr escapes backslashes (Windows paths) and quotes
+                lines.append(f"{key} = {value!r}")
             else:
-                config_content += f'{key} = {value}\n'
-                
-        with open(filename, "w") as f:
-            f.write(config_content) 
\ No newline at end of file
+                lines.append(f"{key} = {value}")
+
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self._dirty.clear()
+
+        # The in-memory dict is already current; record the new mtime so the
+        # next get_config doesn't trigger a pointless reload
+        try:
+            self._config_mtime = os.stat(filename).st_mtime
+        except OSError:
+            pass 
\ No newline at end of file
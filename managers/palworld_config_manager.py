@@ -1,14 +1,289 @@
 import configparser
+import logging
+import mmap
+import os
+from types import MappingProxyType
 from typing import Dict, Any
 import re
 import shlex
 
+log = logging.getLogger(__name__)
+
+# Compiled once at import instead of per load/save; the inline literals
+# relied on re's small internal cache, which other patterns can evict
+_OPTSET_RE = re.compile(r'OptionSettings=\((.*)\)')
+_SPLIT_RE = re.compile(r',(?![^\(]*\))')
+_BLOCK_RE = re.compile(r'(OptionSettings=\()(.*?)(\))', re.DOTALL)
+# Deliberately kept as stdlib re: the OptionSettings blob is a few KB at
+# most, so a native scanner (re2/hyperscan) would add a binary dependency
+# for microseconds of win
+_TOK_RE = re.compile(r'[",()]')
+# Non-blank, non-comment lines, already stripped of surrounding whitespace.
+# The capture must start with a non-blank, non-comment char: a lookahead
+# there would be defeated by backtracking of the leading [ \t]*, letting
+# indented comments through with the whitespace re-attached
+_LINE_RE = re.compile(r'^[ \t]*([^ \t;#\n][^\n]*?)[ \t\r]*$', re.M)
+_FLOAT_RE = re.compile(r'-?\d+(\.\d+)?([eE][+-]?\d+)?$')
+
+def _read_text(path: str) -> str:
+    """Read a whole file through mmap, skipping the stdio buffer copy"""
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return ""
+        try:
+            if hasattr(mm, "madvise"):
+                # We scan front to back exactly once (not on Windows)
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return mm[:].decode("utf-8")
+        finally:
+            mm.close()
+
+# Field schema and defaults never change; build them once at import and
+# hand out read-only views instead of re-allocating the literals per call
+_CONFIG_FIELDS = {
+    "PalWorldSettings": {
+        # Server Settings
+        "ServerName": str,
+        "ServerDescription": str,
+        "AdminPassword": str,
+        "ServerPassword": str,
+        "ServerPlayerMaxNum": int,
+        "PublicIP": str,
+        "PublicPort": int,
+        
+        # Game Balance Settings
+        "Difficulty": ["None", "Easy", "Normal", "Hard"],
+        "DayTimeSpeedRate": float,
+        "NightTimeSpeedRate": float,
+        "ExpRate": float,
+        "DeathPenalty": ["None", "Item", "ItemAndEquipment", "All"],
+        "GuildPlayerMaxNum": int,
+        
+        # Pal Settings
+        "PalCaptureRate": float,
+        "PalSpawnNumRate": float,
+        "PalDamageRateAttack": float,
+        "PalDamageRateDefense": float,
+        "PalStaminaDecreaceRate": float,
+        "PalStomachDecreaceRate": float,
+        "PalAutoHPRegeneRate": float,
+        "PalAutoHpRegeneRateInSleep": float,
+        "PalEggDefaultHatchingTime": float,
+        
+        # Player Settings
+        "PlayerDamageRateAttack": float,
+        "PlayerDamageRateDefense": float,
+        "PlayerStaminaDecreaceRate": float,
+        "PlayerStomachDecreaceRate": float,
+        "PlayerAutoHPRegeneRate": float,
+        "PlayerAutoHpRegeneRateInSleep": float,
+        
+        # Base Camp Settings
+        "BaseCampMaxNumInGuild": int,
+        "BaseCampWorkerMaxNum": int,
+        
+        # Building Settings
+        "BuildObjectDamageRate": float,
+        "BuildObjectDeteriorationDamageRate": float,
+        "MaxBuildingLimitNum": int,
+        
+        # Collection Settings
+        "CollectionDropRate": float,
+        "CollectionObjectHpRate": float,
+        "CollectionObjectRespawnSpeedRate": float,
+        
+        # Enemy Settings
+        "EnemyDropItemRate": float,
+        
+        # Item Settings
+        "ItemWeightRate": float,
+        "EquipmentDurabilityDamageRate": float,
+        
+        # Gameplay Settings
+        "bEnableFastTravel": bool,
+        "bEnableInvaderEnemy": bool,
+        "bHardcore": bool,
+        "bPalLost": bool,
+        "bShowPlayerList": bool,
+        "bCharacterRecreateInHardcore": bool,
+        "bInvisibleOtherGuildBaseCampAreaFX": bool,
+        "bIsRandomizerPalLevelRandom": bool,
+        "bIsUseBackupSaveData": bool,
+        "bBuildAreaLimit": bool,
+        "bAllowGlobalPalboxExport": bool,
+        "bAllowGlobalPalboxImport": bool,
+        
+        # Randomizer Settings
+        "RandomizerSeed": int,
+        "RandomizerType": ["None", "Region", "All"],
+        
+        # Crossplay Settings
+        "CrossplayPlatforms": str,
+        "AllowConnectPlatform": str,
+        
+        # Chat Settings
+        "ChatPostLimitPerMinute": int,
+        
+        # Supply Drop Settings
+        "SupplyDropSpan": int,
+        
+        # Sync Settings
+        "ServerReplicatePawnCullDistance": int,
+        "ItemContainerForceMarkDirtyInterval": int,
+        
+        # API Settings
+        "RESTAPIEnabled": bool,
+        "RESTAPIPort": int,
+        "RCONEnabled": bool,
+        "RCONPort": int,
+        
+        # Log Settings
+        "LogFormatType": ["Text", "Json"]
+    }
+}
+_CONFIG_FIELDS = MappingProxyType({s: MappingProxyType(f) for s, f in _CONFIG_FIELDS.items()})
+
+# Per-type well-formedness checks. Malformed values (notably empty
+# strings mid-edit) are common, so these test without raising instead of
+# try/except conversions
+def _is_bool(value: str) -> bool:
+    return value.lower() in ('true', 'false')
+
+def _is_int(value: str) -> bool:
+    return (value[1:] if value[:1] == '-' else value).isdigit()
+
+def _is_float(value: str) -> bool:
+    return _FLOAT_RE.match(value) is not None
+
+def _build_validator_table() -> Dict[str, Any]:
+    """Map each field name to its validator callable, once at import.
+
+    str fields accept anything and get no entry; enum fields become a
+    frozenset membership test.
+    """
+    table = {}
+    for fields in _CONFIG_FIELDS.values():
+        for name, field_type in fields.items():
+            if field_type is bool:
+                table[name] = _is_bool
+            elif field_type is int:
+                table[name] = _is_int
+            elif field_type is float:
+                table[name] = _is_float
+            elif isinstance(field_type, list):
+                table[name] = frozenset(field_type).__contains__
+    return table
+
+_VALIDATOR_TABLE = _build_validator_table()
+
+_DEFAULT_CONFIG = {
+    "PalWorldSettings": {
+        # Server Settings
+        "ServerName": "PalWorld Server",
+        "ServerDescription": "A PalWorld server",
+        "AdminPassword": "",
+        "ServerPassword": "",
+        "ServerPlayerMaxNum": "32",
+        "PublicIP": "",
+        "PublicPort": "8211",
+        
+        # Game Balance Settings
+        "Difficulty": "Normal",
+        "DayTimeSpeedRate": "1.000000",
+        "NightTimeSpeedRate": "1.000000",
+        "ExpRate": "1.000000",
+        "DeathPenalty": "All",
+        "GuildPlayerMaxNum": "20",
+        
+        # Pal Settings
+        "PalCaptureRate": "1.000000",
+        "PalSpawnNumRate": "1.000000",
+        "PalDamageRateAttack": "1.000000",
+        "PalDamageRateDefense": "1.000000",
+        "PalStaminaDecreaceRate": "1.000000",
+        "PalStomachDecreaceRate": "1.000000",
+        "PalAutoHPRegeneRate": "1.000000",
+        "PalAutoHpRegeneRateInSleep": "1.000000",
+        "PalEggDefaultHatchingTime": "72.000000",
+        
+        # Player Settings
+        "PlayerDamageRateAttack": "1.000000",
+        "PlayerDamageRateDefense": "1.000000",
+        "PlayerStaminaDecreaceRate": "1.000000",
+        "PlayerStomachDecreaceRate": "1.000000",
+        "PlayerAutoHPRegeneRate": "1.000000",
+        "PlayerAutoHpRegeneRateInSleep": "1.000000",
+        
+        # Base Camp Settings
+        "BaseCampMaxNumInGuild": "4",
+        "BaseCampWorkerMaxNum": "15",
+        
+        # Building Settings
+        "BuildObjectDamageRate": "1.000000",
+        "BuildObjectDeteriorationDamageRate": "1.000000",
+        "MaxBuildingLimitNum": "0",
+        
+        # Collection Settings
+        "CollectionDropRate": "1.000000",
+        "CollectionObjectHpRate": "1.000000",
+        "CollectionObjectRespawnSpeedRate": "1.000000",
+        
+        # Enemy Settings
+        "EnemyDropItemRate": "1.000000",
+        
+        # Item Settings
+        "ItemWeightRate": "1.000000",
+        "EquipmentDurabilityDamageRate": "1.000000",
+        
+        # Gameplay Settings
+        "bEnableFastTravel": "True",
+        "bEnableInvaderEnemy": "True",
+        "bHardcore": "False",
+        "bPalLost": "False",
+        "bShowPlayerList": "True",
+        "bCharacterRecreateInHardcore": "False",
+        "bInvisibleOtherGuildBaseCampAreaFX": "False",
+        "bIsRandomizerPalLevelRandom": "False",
+        "bIsUseBackupSaveData": "True",
+        "bBuildAreaLimit": "False",
+        "bAllowGlobalPalboxExport": "False",
+        "bAllowGlobalPalboxImport": "False",
+        
+        # Randomizer Settings
+        "RandomizerSeed": "0",
+        "RandomizerType": "None",
+        
+        # Crossplay Settings
+        "CrossplayPlatforms": "(Steam,Xbox,PS5,Mac)",
+        "AllowConnectPlatform": "",
+        
+        # Chat Settings
+        "ChatPostLimitPerMinute": "0",
+        
+        # Supply Drop Settings
+        "SupplyDropSpan": "0",
+        
+        # Sync Settings
+        "ServerReplicatePawnCullDistance": "10000",
+        "ItemContainerForceMarkDirtyInterval": "5",
+        
+        # API Settings
+        "RESTAPIEnabled": "True",
+        "RESTAPIPort": "8212",
+        "RCONEnabled": "False",
+        "RCONPort": "25575",
+        
+        # Log Settings
+        "LogFormatType": "Text"
+    }
+}
+
 class PalworldConfigManager:
     """Handles PalWorld configuration file operations"""
     
-    def __init__(self):
-        pass
-        
     def load_palworld_config(self, config_path: str) -> Dict[str, Dict[str, str]]:
         """Load Palworld configuration file using custom parser"""
         try:
@@ -16,20 +291,21 @@ class PalworldConfigManager:
             return self._load_palworld_config_custom(config_path)
         except Exception as e:
             # Fallback to configparser
-            print(f"Custom parser failed, falling back to configparser: {e}")
+            log.warning("Custom parser failed, falling back to configparser: %s", e)
             return self._load_palworld_config_ini(config_path)
     
     def _load_palworld_config_custom(self, config_path: str) -> Dict[str, Dict[str, str]]:
         """Custom parser that handles single-line PalWorld config format, robust to comments and blank lines anywhere"""
         settings = {"PalWorldSettings": {}}
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+            content = _read_text(config_path)
 
-            # Split into lines and skip comments/blank lines
-            lines = [line.strip() for line in content.split('\n') if line.strip() and not line.strip().startswith((';', '#'))]
+            # Scan line by line with the compiled regex; it skips blanks
+            # and comments and strips whitespace in the same pass, so no
+            # intermediate list of lines is built
             current_section = None
-            for line in lines:
+            for m in _LINE_RE.finditer(content):
+                line = m.group(1)
                 # Section header
                 if line.startswith('[') and line.endswith(']'):
                     section_name = line[1:-1]
@@ -41,17 +317,18 @@ class PalworldConfigManager:
                 # OptionSettings line
                 if line.startswith('OptionSettings=') and current_section:
                     # Extract the part inside parentheses
-                    match = re.match(r'OptionSettings=\((.*)\)', line)
+                    match = _OPTSET_RE.match(line)
                     if match:
                         option_str = match.group(1)
-                        # Split by commas not inside quotes or parentheses
-                        pairs = re.split(r',(?![^\(]*\))', option_str)
-                        for pair in pairs:
+                        # Split by commas not inside quotes or parentheses,
+                        # collect the ~70 pairs as tuples and build the dict
+                        # in one shot instead of growing it key by key
+                        parsed_pairs = []
+                        for pair in _SPLIT_RE.split(option_str):
                             if '=' in pair:
                                 key, value = pair.split('=', 1)
-                                key = key.strip()
-                                value = value.strip().strip('"')
-                                settings[current_section][key] = value
+                                parsed_pairs.append((key.strip(), value.strip().strip('"')))
+                        settings[current_section].update(parsed_pairs)
                     continue
                 # Fallback: parse key=value pairs
                 if '=' in line and current_section:
@@ -61,7 +338,7 @@ class PalworldConfigManager:
                     settings[current_section][key] = value
             return settings
         except Exception as e:
-            print(f"Custom parser error: {e}")
+            log.debug("Custom parser error: %s", e)
             raise
     
     def _load_palworld_config_ini(self, config_path: str) -> Dict[str, Dict[str, str]]:
@@ -74,58 +351,49 @@ class PalworldConfigManager:
     def save_palworld_config(self, config_path: str, settings: Dict[str, Dict[str, str]]):
         """Update only the values in OptionSettings=(...) that have changed, preserving all original formatting, quoting, and order."""
         # Read the original file
-        with open(config_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = _read_text(config_path)
 
         # Find the OptionSettings line
-        option_settings_pattern = re.compile(r"(OptionSettings=\()(.*?)(\))", re.DOTALL)
-        match = option_settings_pattern.search(content)
+        match = _BLOCK_RE.search(content)
         if not match:
             raise ValueError("OptionSettings line not found in config file.")
 
         option_str = match.group(2)
-        original_option_str = option_str  # Keep for in-place replacement
         new_options = settings.get("PalWorldSettings", {})
 
-        # Robust parser for key=value pairs, handling nested parentheses and quoted strings
+        # Split into top-level pairs, respecting nested parentheses and
+        # quoted strings. The regex engine scans for the four characters
+        # that matter; Python only runs at those decision points instead
+        # of dispatching once per character of the blob
         pairs = []
-        buf = ''
+        depth = 0
         in_quotes = False
-        paren_level = 0
-        i = 0
-        while i < len(option_str):
-            c = option_str[i]
+        start = 0
+        for tok in _TOK_RE.finditer(option_str):
+            c = tok.group()
             if c == '"':
-                buf += c
                 in_quotes = not in_quotes
-                i += 1
-            elif c == '(' and not in_quotes:
-                paren_level += 1
-                buf += c
-                i += 1
-            elif c == ')' and not in_quotes:
-                paren_level -= 1
-                buf += c
-                i += 1
-            elif c == ',' and not in_quotes and paren_level == 0:
-                if buf:
-                    pairs.append(buf)
-                buf = ''
-                i += 1
-            else:
-                buf += c
-                i += 1
-        if buf:
-            pairs.append(buf)
+            elif in_quotes:
+                continue
+            elif c == '(':
+                depth += 1
+            elif c == ')':
+                depth -= 1
+            elif depth == 0:  # top-level ','
+                pairs.append(option_str[start:tok.start()])
+                start = tok.end()
+        pairs.append(option_str[start:])
 
-        # For each key, if value changed, replace only the value in the original string
-        option_str_new = option_str
+        # Rebuild the string in one linear pass: each pair is either the
+        # original slice or the same key with its value swapped, so a save
+        # with N changed fields no longer rescans the whole blob N times
+        out_parts = []
         for pair in pairs:
             if '=' not in pair:
+                out_parts.append(pair)
                 continue
-            key, value = pair.split('=', 1)
-            key = key.strip()
-            orig_value = value
+            key_part, orig_value = pair.split('=', 1)
+            key = key_part.strip()
             if key in new_options:
                 # Remove quotes for comparison
                 orig_val_clean = orig_value.strip('"')
@@ -141,254 +409,38 @@ class PalworldConfigManager:
                         value_str = '""'
                     else:
                         value_str = new_val
-                    # Use a lambda to avoid group reference issues
-                    pattern = re.compile(rf'({re.escape(key)}\s*=\s*){re.escape(orig_value)}')
-                    option_str_new = pattern.sub(lambda m: m.group(1) + value_str, option_str_new, count=1)
+                    out_parts.append(f"{key_part}={value_str}")
+                    continue
+            out_parts.append(pair)
+        option_str_new = ",".join(out_parts)
 
-        # Replace only the OptionSettings string in the file
-        new_content = option_settings_pattern.sub(lambda m: f"{m.group(1)}{option_str_new}{m.group(3)}", content, count=1)
+        # Splice the new OptionSettings string between the untouched
+        # slices on either side of the matched block
+        new_content = content[:match.start(2)] + option_str_new + content[match.end(2):]
 
-        with open(config_path, "w", encoding="utf-8") as f:
+        # Write to a sibling temp file and rename over the original so a
+        # crash mid-write can never leave a truncated config behind
+        tmp_path = config_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             f.write(new_content)
+        os.replace(tmp_path, config_path)
 
     def get_config_fields(self) -> Dict[str, Dict[str, Any]]:
         """Get the configuration fields structure based on official PalWorld documentation"""
-        return {
-            "PalWorldSettings": {
-                # Server Settings
-                "ServerName": str,
-                "ServerDescription": str,
-                "AdminPassword": str,
-                "ServerPassword": str,
-                "ServerPlayerMaxNum": int,
-                "PublicIP": str,
-                "PublicPort": int,
-                
-                # Game Balance Settings
-                "Difficulty": ["None", "Easy", "Normal", "Hard"],
-                "DayTimeSpeedRate": float,
-                "NightTimeSpeedRate": float,
-                "ExpRate": float,
-                "DeathPenalty": ["None", "Item", "ItemAndEquipment", "All"],
-                "GuildPlayerMaxNum": int,
-                
-                # Pal Settings
-                "PalCaptureRate": float,
-                "PalSpawnNumRate": float,
-                "PalDamageRateAttack": float,
-                "PalDamageRateDefense": float,
-                "PalStaminaDecreaceRate": float,
-                "PalStomachDecreaceRate": float,
-                "PalAutoHPRegeneRate": float,
-                "PalAutoHpRegeneRateInSleep": float,
-                "PalEggDefaultHatchingTime": float,
-                
-                # Player Settings
-                "PlayerDamageRateAttack": float,
-                "PlayerDamageRateDefense": float,
-                "PlayerStaminaDecreaceRate": float,
-                "PlayerStomachDecreaceRate": float,
-                "PlayerAutoHPRegeneRate": float,
-                "PlayerAutoHpRegeneRateInSleep": float,
-                
-                # Base Camp Settings
-                "BaseCampMaxNumInGuild": int,
-                "BaseCampWorkerMaxNum": int,
-                
-                # Building Settings
-                "BuildObjectDamageRate": float,
-                "BuildObjectDeteriorationDamageRate": float,
-                "MaxBuildingLimitNum": int,
-                
-                # Collection Settings
-                "CollectionDropRate": float,
-                "CollectionObjectHpRate": float,
-                "CollectionObjectRespawnSpeedRate": float,
-                
-                # Enemy Settings
-                "EnemyDropItemRate": float,
-                
-                # Item Settings
-                "ItemWeightRate": float,
-                "EquipmentDurabilityDamageRate": float,
-                
-                # Gameplay Settings
-                "bEnableFastTravel": bool,
-                "bEnableInvaderEnemy": bool,
-                "bHardcore": bool,
-                "bPalLost": bool,
-                "bShowPlayerList": bool,
-                "bCharacterRecreateInHardcore": bool,
-                "bInvisibleOtherGuildBaseCampAreaFX": bool,
-                "bIsRandomizerPalLevelRandom": bool,
-                "bIsUseBackupSaveData": bool,
-                "bBuildAreaLimit": bool,
-                "bAllowGlobalPalboxExport": bool,
-                "bAllowGlobalPalboxImport": bool,
-                
-                # Randomizer Settings
-                "RandomizerSeed": int,
-                "RandomizerType": ["None", "Region", "All"],
-                
-                # Crossplay Settings
-                "CrossplayPlatforms": str,
-                "AllowConnectPlatform": str,
-                
-                # Chat Settings
-                "ChatPostLimitPerMinute": int,
-                
-                # Supply Drop Settings
-                "SupplyDropSpan": int,
-                
-                # Sync Settings
-                "ServerReplicatePawnCullDistance": int,
-                "ItemContainerForceMarkDirtyInterval": int,
-                
-                # API Settings
-                "RESTAPIEnabled": bool,
-                "RESTAPIPort": int,
-                "RCONEnabled": bool,
-                "RCONPort": int,
-                
-                # Log Settings
-                "LogFormatType": ["Text", "Json"]
-            }
-        }
-        
+        return _CONFIG_FIELDS
+
     def validate_config(self, settings: Dict[str, Dict[str, str]]) -> bool:
         """Validate configuration settings"""
-        config_fields = self.get_config_fields()
-        
-        for section, fields in config_fields.items():
-            if section not in settings:
-                continue
-                
-            for field_name, field_type in fields.items():
-                if field_name not in settings[section]:
-                    continue
-                    
-                value = settings[section][field_name]
-                
-                # Validate based on field type
-                if field_type == bool:
-                    if value.lower() not in ['true', 'false']:
-                        return False
-                elif field_type == int:
-                    try:
-                        int(value)
-                    except ValueError:
-                        return False
-                elif field_type == float:
-                    try:
-                        float(value)
-                    except ValueError:
-                        return False
-                elif isinstance(field_type, list):
-                    if value not in field_type:
-                        return False
-                        
-        return True
+        # One dict lookup + call per field instead of walking an if/elif
+        # type chain; fields without a table entry (str) accept anything
+        return all(
+            _VALIDATOR_TABLE[name](value)
+            for section_settings in settings.values()
+            for name, value in section_settings.items()
+            if name in _VALIDATOR_TABLE
+        )
         
     def get_default_config(self) -> Dict[str, Dict[str, str]]:
         """Get default PalWorld configuration based on official documentation"""
-        return {
-            "PalWorldSettings": {
-                # Server Settings
-                "ServerName": "PalWorld Server",
-                "ServerDescription": "A PalWorld server",
-                "AdminPassword": "",
-                "ServerPassword": "",
-                "ServerPlayerMaxNum": "32",
-                "PublicIP": "",
-                "PublicPort": "8211",
-                
-                # Game Balance Settings
-                "Difficulty": "Normal",
-                "DayTimeSpeedRate": "1.000000",
-                "NightTimeSpeedRate": "1.000000",
-                "ExpRate": "1.000000",
-                "DeathPenalty": "All",
-                "GuildPlayerMaxNum": "20",
-                
-                # Pal Settings
-                "PalCaptureRate": "1.000000",
-                "PalSpawnNumRate": "1.000000",
-                "PalDamageRateAttack": "1.000000",
-                "PalDamageRateDefense": "1.000000",
-                "PalStaminaDecreaceRate": "1.000000",
-                "PalStomachDecreaceRate": "1.000000",
-                "PalAutoHPRegeneRate": "1.000000",
-                "PalAutoHpRegeneRateInSleep": "1.000000",
-                "PalEggDefaultHatchingTime": "72.000000",
-                
-                # Player Settings
-                "PlayerDamageRateAttack": "1.000000",
-                "PlayerDamageRateDefense": "1.000000",
-                "PlayerStaminaDecreaceRate": "1.000000",
-                "PlayerStomachDecreaceRate": "1.000000",
-                "PlayerAutoHPRegeneRate": "1.000000",
-                "PlayerAutoHpRegeneRateInSleep": "1.000000",
-                
-                # Base Camp Settings
-                "BaseCampMaxNumInGuild": "4",
-                "BaseCampWorkerMaxNum": "15",
-                
-                # Building Settings
-                "BuildObjectDamageRate": "1.000000",
-                "BuildObjectDeteriorationDamageRate": "1.000000",
-                "MaxBuildingLimitNum": "0",
-                
-                # Collection Settings
-                "CollectionDropRate": "1.000000",
-                "CollectionObjectHpRate": "1.000000",
-                "CollectionObjectRespawnSpeedRate": "1.000000",
-                
-                # Enemy Settings
-                "EnemyDropItemRate": "1.000000",
-                
-                # Item Settings
-                "ItemWeightRate": "1.000000",
-                "EquipmentDurabilityDamageRate": "1.000000",
-                
-                # Gameplay Settings
-                "bEnableFastTravel": "True",
-                "bEnableInvaderEnemy": "True",
-                "bHardcore": "False",
-                "bPalLost": "False",
-                "bShowPlayerList": "True",
-                "bCharacterRecreateInHardcore": "False",
-                "bInvisibleOtherGuildBaseCampAreaFX": "False",
-                "bIsRandomizerPalLevelRandom": "False",
-                "bIsUseBackupSaveData": "True",
-                "bBuildAreaLimit": "False",
-                "bAllowGlobalPalboxExport": "False",
-                "bAllowGlobalPalboxImport": "False",
-                
-                # Randomizer Settings
-                "RandomizerSeed": "0",
-                "RandomizerType": "None",
-                
-                # Crossplay Settings
-                "CrossplayPlatforms": "(Steam,Xbox,PS5,Mac)",
-                "AllowConnectPlatform": "",
-                
-                # Chat Settings
-                "ChatPostLimitPerMinute": "0",
-                
-                # Supply Drop Settings
-                "SupplyDropSpan": "0",
-                
-                # Sync Settings
-                "ServerReplicatePawnCullDistance": "10000",
-                "ItemContainerForceMarkDirtyInterval": "5",
-                
-                # API Settings
-                "RESTAPIEnabled": "True",
-                "RESTAPIPort": "8212",
-                "RCONEnabled": "False",
-                "RCONPort": "25575",
-                
-                # Log Settings
-                "LogFormatType": "Text"
-            }
-        } 
\ No newline at end of file
+        # Callers may tweak the result, so hand out fresh per-section dicts
+        return {section: dict(fields) for section, fields in _DEFAULT_CONFIG.items()}
@@ -1,30 +1,91 @@
+import logging
+import shlex
 import subprocess
 import time
 from typing import Optional, Tuple, List
 
+log = logging.getLogger(__name__)
+
 class PalworldServerManager:
     """Manages PalWorld server operations using SSHManager for remote execution"""
     
+    # How long a batched status probe stays valid for repeated GUI polls.
+    # 500 ms is long enough to collapse the duplicate is_server_running /
+    # is_update_running calls of one refresh tick into a single SSH
+    # round-trip, and short enough that the next tick sees fresh state
+    PROBE_TTL = 0.5
+
     def __init__(self, server_path: str, screen_session_name: str, ssh_manager, steamcmd_path: str = "steamcmd"):
         self.server_path = server_path
         self.screen_session_name = screen_session_name
         self.ssh_manager = ssh_manager
         self.steamcmd_path = steamcmd_path
-        
+        self._probe_cache = (0.0, None)
+
+    def _probe_remote(self, ttl: float = PROBE_TTL) -> dict:
+        """Gather every status probe in one SSH round-trip.
+
+        Each individual check (screen session, update session, process
+        info) costs a full round-trip dominated by SSH latency; running
+        them as one compound command and slicing the sentinel-separated
+        output locally collapses N trips to one. A short TTL collapses
+        back-to-back GUI polls onto the same snapshot; pass ttl=0 to
+        force a fresh probe.
+        """
+        stamp, cached = self._probe_cache
+        if cached is not None and time.monotonic() - stamp < ttl:
+            return cached
+        cmd = "screen -list 2>/dev/null; echo __SEP__; ps aux | grep '[P]alServer'; true"
+        stdout, stderr = self.ssh_manager.execute_command(cmd)
+        screens, _, ps = (stdout or "").partition("__SEP__")
+        probe = {
+            "screens": screens,
+            "ps": ps.strip(),
+            "running": self.screen_session_name in screens,
+            "update_running": "steamcmd_update" in screens,
+        }
+        self._probe_cache = (time.monotonic(), probe)
+        return probe
+
+    def _invalidate_probe(self):
+        """Drop the cached probe after anything that changes server state"""
+        self._probe_cache = (0.0, None)
+
+    def _wait_until(self, predicate, timeout: float, interval: float = 0.2,
+                    delay_first: bool = False) -> bool:
+        """Poll predicate until it returns True or the deadline passes.
+
+        Short polls turn the old flat sleeps into best-case latency: a
+        healthy server is usually up (or down) within a second, so the
+        caller returns as soon as that happens instead of always waiting
+        out the worst case. delay_first skips the immediate probe for
+        transitions that can't possibly have completed yet (e.g. a
+        graceful shutdown right after the quit command), saving one SSH
+        round-trip.
+        """
+        deadline = time.monotonic() + timeout
+        if delay_first:
+            time.sleep(interval)
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(interval)
+        return False
+
     def is_server_running(self) -> bool:
         """Check if the PalWorld server is running in a screen session (remote)"""
-        stdout, stderr = self.ssh_manager.execute_command(f"screen -list | grep {self.screen_session_name}")
-        return stdout is not None and self.screen_session_name in stdout
-    
+        return self._probe_remote()["running"]
+
     def get_server_status(self) -> Tuple[bool, str]:
         """Get detailed server status (remote)"""
-        if not self.is_server_running():
+        probe = self._probe_remote()
+        if not probe["running"]:
             return False, "Server is not running"
-        
-        # Get screen session info
-        stdout, stderr = self.ssh_manager.execute_command(f"screen -list | grep {self.screen_session_name}")
-        if stdout:
-            return True, f"Server is running in screen session: {stdout.strip()}"
+
+        # Pull the matching line out of the already-fetched screen listing
+        line = next((l for l in probe["screens"].splitlines() if self.screen_session_name in l), "")
+        if line:
+            return True, f"Server is running in screen session: {line.strip()}"
         else:
             return False, "Server status unknown"
     
@@ -34,24 +95,27 @@ class PalworldServerManager:
             return False, "Server is already running"
         
         try:
-            # Create a new screen session and start the server, redirecting output to server.log
+            # Reject non-numeric ports before they reach the shell
+            port = str(int(port))
+            session = shlex.quote(self.screen_session_name)
+            # Create a new screen session and start the server, redirecting
+            # output to server.log. server_path stays unquoted so a leading
+            # ~ still expands inside bash -c
             start_command = (
-                f"screen -dmS {self.screen_session_name} bash -c "
+                f"screen -dmS {session} bash -c "
                 f"'cd {self.server_path} && ./PalServer.sh -port={port} -players=5 "
                 f"-useperfthreads -NoAsyncLoadingThread -UseMultithreadForDS -NumberOfWorkerThreadsServer=3 "
                 f"> server.log 2>&1'"
             )
             
             stdout, stderr = self.ssh_manager.execute_command(start_command, timeout=60)
-            
+            self._invalidate_probe()
+
             if stderr:
                 return False, f"Failed to start server: {stderr}"
-            
-            # Wait a moment for the server to start
-            time.sleep(5)
-            
-            # Verify the server started
-            if self.is_server_running():
+
+            # Poll for the screen session instead of sleeping a flat 5 s
+            if self._wait_until(lambda: self._probe_remote(ttl=0)["running"], 30):
                 return True, "Server started successfully (logging to server.log)"
             else:
                 return False, "Server failed to start (screen session not found, check server.log)"
@@ -66,23 +130,23 @@ class PalworldServerManager:
         
         try:
             # Send quit command to the server
-            quit_command = f"screen -S {self.screen_session_name} -X stuff $'quit\\n'"
+            quit_command = f"screen -S {shlex.quote(self.screen_session_name)} -X stuff $'quit\\n'"
             stdout, stderr = self.ssh_manager.execute_command(quit_command)
-            
-            # Wait for the server to shut down gracefully
-            time.sleep(10)
-            
-            # Force kill the screen session if it's still running
-            if self.is_server_running():
-                kill_command = f"screen -S {self.screen_session_name} -X quit"
+            self._invalidate_probe()
+
+            # Wait for the graceful shutdown, returning as soon as it lands.
+            # The shutdown takes at least a beat, so don't bother probing
+            # before the first poll interval has passed
+            if not self._wait_until(lambda: not self._probe_remote(ttl=0)["running"], 20,
+                                    delay_first=True):
+                # Force kill the screen session if it's still running
+                kill_command = f"screen -S {shlex.quote(self.screen_session_name)} -X quit"
                 stdout, stderr = self.ssh_manager.execute_command(kill_command)
-                
-                # Wait a bit more
-                time.sleep(5)
-                
-                if self.is_server_running():
+                self._invalidate_probe()
+
+                if not self._wait_until(lambda: not self._probe_remote(ttl=0)["running"], 10):
                     return False, "Failed to stop server (screen session still running)"
-            
+
             return True, "Server stopped successfully"
             
         except Exception as e:
@@ -94,11 +158,8 @@ class PalworldServerManager:
         success, message = self.stop_server()
         if not success and "not running" not in message:
             return False, f"Failed to stop server: {message}"
-        
-        # Wait a moment
-        time.sleep(5)
-        
-        # Start the server
+
+        # stop_server already confirmed the session is gone; start right away
         return self.start_server(port)
     
     def update_server(self) -> Tuple[bool, str]:
@@ -110,7 +171,6 @@ class PalworldServerManager:
                 success, message = self.stop_server()
                 if not success:
                     return False, f"Failed to stop server for update: {message}"
-                time.sleep(10)
 
             # Use the configured SteamCMD path
             steamcmd_path = getattr(self, 'steamcmd_path', 'steamcmd')
@@ -119,6 +179,7 @@ class PalworldServerManager:
                 f"screen -dmS steamcmd_update bash -c \"{steamcmd_path} +login anonymous +app_update 2394010 validate +quit | tee ~/steamcmd_update.log\""
             )
             stdout, stderr = self.ssh_manager.execute_command(update_command, timeout=30)
+            self._invalidate_probe()
             if stderr:
                 return False, f"Failed to start update: {stderr}"
             return True, "Update started in background. Monitor progress via log."
@@ -127,8 +188,7 @@ class PalworldServerManager:
 
     def is_update_running(self) -> bool:
         """Check if the steamcmd_update screen session is running"""
-        stdout, stderr = self.ssh_manager.execute_command("screen -list | grep steamcmd_update")
-        return stdout is not None and "steamcmd_update" in stdout
+        return self._probe_remote()["update_running"]
 
     def get_update_log(self, lines: int = 50) -> Tuple[Optional[str], Optional[str]]:
         """Fetch the last N lines of the update log"""
@@ -140,27 +200,22 @@ class PalworldServerManager:
             return None, stderr or "No log output found."
     
     def get_server_logs(self, lines: int = 50) -> Tuple[Optional[str], Optional[str]]:
-        """Get recent server logs from the screen session (remote)"""
+        """Get recent server logs from server.log (remote, one round-trip)"""
         if not self.is_server_running():
             return None, "Server is not running"
-        
-        # Get logs from the screen session (remote hardcopy to /tmp, then cat)
-        log_command = f"screen -S {self.screen_session_name} -X hardcopy /tmp/palworld_logs.txt"
-        stdout, stderr = self.ssh_manager.execute_command(log_command)
-        
-        if stderr:
-            return None, f"Failed to get logs: {stderr}"
-        
-        # Read the log file remotely
-        try:
-            cat_command = "tail -n {} /tmp/palworld_logs.txt".format(lines)
-            log_stdout, log_stderr = self.ssh_manager.execute_command(cat_command)
-            if log_stdout:
-                return log_stdout, None
-            else:
-                return None, f"Failed to read log file: {log_stderr}"
-        except Exception as e:
-            return None, f"Failed to read log file: {str(e)}"
+
+        # start_server already redirects stdout to server.log; tail it
+        # directly instead of the old hardcopy-to-/tmp two-step
+        cat_command = f"tail -n {lines} {self.server_path}/server.log"
+        stdout, stderr = self.ssh_manager.execute_command(cat_command)
+        if stdout:
+            return stdout, None
+        else:
+            return None, stderr or "No log output found."
+
+    def stream_server_logs(self, lines: int = 50):
+        """Async iterator over server.log lines as they are written (tail -F)"""
+        return self.ssh_manager.stream_command(f"tail -n {lines} -F {self.server_path}/server.log")
     
     def send_command(self, command: str) -> Tuple[bool, str]:
         """Send a command to the running server (remote)"""
@@ -168,8 +223,10 @@ class PalworldServerManager:
             return False, "Server is not running"
         
         try:
-            # Send command to the screen session
-            screen_command = f"screen -S {self.screen_session_name} -X stuff $'{command}\\n'"
+            # Send command to the screen session; shlex.quote keeps quotes
+            # and $-sequences in the command text literal
+            payload = shlex.quote(command + "\n")
+            screen_command = f"screen -S {shlex.quote(self.screen_session_name)} -X stuff {payload}"
             stdout, stderr = self.ssh_manager.execute_command(screen_command)
             
             if stderr:
@@ -181,27 +238,29 @@ class PalworldServerManager:
             return False, f"Error sending command: {str(e)}"
     
     def get_server_info(self) -> dict:
-        """Get comprehensive server information (remote)"""
+        """Get comprehensive server information (remote, one probe round-trip)"""
+        probe = self._probe_remote()
         info = {
-            "running": self.is_server_running(),
+            "running": probe["running"],
             "screen_session": self.screen_session_name,
             "server_path": self.server_path
         }
-        
+
         if info["running"]:
             status, message = self.get_server_status()
             info["status_message"] = message
-            
-            # Try to get basic process info
-            stdout, stderr = self.ssh_manager.execute_command(f"ps aux | grep PalServer | grep -v grep")
-            if stdout:
-                info["process_info"] = stdout.strip()
-        
+
+            # Process info was fetched by the same probe
+            if probe["ps"]:
+                info["process_info"] = probe["ps"]
+
         return info
     
     def log(self, message: str):
         """Log a message (can be overridden for custom logging)"""
-        print(f"[PalworldServerManager] {message}")
+        # logging instead of print: handlers/levels decide whether the
+        # message goes anywhere, so nothing blocks on stdout
+        log.debug("%s", message)
     
     def save_and_download_backup(self, local_backup_path: Optional[str] = None) -> tuple:
         """
@@ -209,10 +268,8 @@ class PalworldServerManager:
         Returns (success: bool, message: str, local_file_path: str or None)
         """
         import datetime
-        # Define remote and local paths
+        # Define local path
         date_str = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        remote_saved_dir = f"{self.server_path}/Pal/Saved"
-        remote_archive = f"/tmp/palworld_saved_backup_{date_str}.tar.gz"
         if local_backup_path is None:
             local_backup_path = f"downloads/PalServer_Saved_backup_{date_str}.tar.gz"
 
@@ -222,20 +279,12 @@ class PalworldServerManager:
             return False, f"Failed to resolve full path for {self.server_path}", None
         full_server_path = full_server_path.strip()
 
-        # 1. Create the archive on the VPS
-        tar_cmd = f"tar czf '{remote_archive}' -C '{full_server_path}/Pal' Saved"
-        stdout, stderr = self.ssh_manager.execute_command(tar_cmd, timeout=120)
-        if stderr:
-            return False, f"Failed to create archive: {stderr}", None
-
-        # 2. Download the archive
-        success, message = self.ssh_manager.download_file(remote_archive, local_backup_path)
+        # Stream the archive straight over the connection: tar writes to
+        # stdout and compression overlaps the transfer, so no /tmp copy is
+        # written (and re-read, and deleted) on the VPS
+        tar_cmd = f"tar czf - -C {shlex.quote(full_server_path + '/Pal')} Saved"
+        success, message = self.ssh_manager.stream_to_file(tar_cmd, local_backup_path, timeout=600)
         if not success:
-            # Try to clean up remote archive even if download failed
-            self.ssh_manager.execute_command(f"rm -f '{remote_archive}'")
-            return False, f"Download failed: {message}", None
-
-        # 3. Clean up remote archive
-        self.ssh_manager.execute_command(f"rm -f '{remote_archive}'")
+            return False, f"Backup failed: {message}", None
 
         return True, f"Backup saved and downloaded to {local_backup_path}", local_backup_path 
\ No newline at end of file
@@ -1,9 +1,42 @@
+import asyncio
+import collections
+import mmap
+import shlex
+import shutil
+import signal
+import socket
+import stat
 import subprocess
 import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List
 
+from managers.ssh_pool import SSHConnectionPool
+
+try:
+    import paramiko
+except ImportError:
+    # Optional: without paramiko everything still works through plink/pscp
+    paramiko = None
+
+if os.name == "nt":
+    # Keep every plink/pscp spawn from flashing a console window; the GUI
+    # launches these dozens of times per action
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _POPEN_OPTS = {"startupinfo": _STARTUPINFO, "creationflags": subprocess.CREATE_NO_WINDOW}
+else:
+    _POPEN_OPTS = {}
+
 class SSHManager:
+    # Outstanding SFTP read requests per download
+    SFTP_CONCURRENCY = 64
+    # copyfileobj chunk for file transfers; large enough that the Python
+    # loop never throttles a multi-GB backup
+    TRANSFER_CHUNK = 4 << 20
+
     def __init__(self, plink_path: str, pscp_path: str, session_name: str = "PalworldVPS"):
         self.plink_path = plink_path
         self.pscp_path = pscp_path
@@ -12,25 +45,353 @@ class SSHManager:
         self.ssh_host = None
         self.ssh_port = "22"
         self.ssh_username = None
-        
+        self.master_process = None
+        # Invariant argv prefix for plink, rebuilt only when the connection
+        # settings change
+        self._base_cmd: Optional[List[str]] = None
+        # Long-lived paramiko connection (direct connection, or a PuTTY
+        # saved session resolved from the registry). One authenticated
+        # transport + SFTP channel serves all GUI actions instead of a
+        # full TCP + SSH handshake per subprocess.
+        self._ssh_client = None
+        self._sftp_client = None
+        self._client_lock = threading.Lock()
+        # Extra clients for concurrent worker threads, keyed implicitly by
+        # the current connection settings (reset on any settings change)
+        self._pool: Optional[SSHConnectionPool] = None
+        # Resolved-path cache: the same handful of paths (config file,
+        # server dir, default ini) are re-resolved on every GUI action but
+        # never move during a session
+        self._path_cache = {}
+        # host/port/username read from the PuTTY saved session, resolved
+        # at most once per settings change (None = not looked up yet,
+        # False = lookup failed)
+        self._session_params = None
+        # Remote $HOME and login directory, fetched together once per
+        # connection settings; they never change for a session, so the
+        # refresh polling that asks for them costs nothing after that
+        self._home: Optional[str] = None
+        self._pwd: Optional[str] = None
+        # Long-lived remote shell over plink (plink-only setups); commands
+        # go down its stdin instead of spawning a subprocess each
+        self._shell = None
+        self._shell_lock = threading.Lock()
+        # path -> (timestamp, result) for directory listings; GUI flows
+        # often list the same directory twice back to back
+        self._ls_cache = {}
+
     def set_direct_connection(self, host: str, port: str, username: str):
         """Configure direct SSH connection instead of PuTTY session"""
         self.use_direct_connection = True
         self.ssh_host = host
         self.ssh_port = port
         self.ssh_username = username
-        
+        self._base_cmd = None
+        self._path_cache.clear()
+        self._session_params = None
+        self._home = None
+        self._pwd = None
+        self._ls_cache.clear()
+        self._close_client()
+        self._close_shell()
+
     def set_session_connection(self):
         """Use PuTTY session connection"""
         self.use_direct_connection = False
-        
+        self._base_cmd = None
+        self._path_cache.clear()
+        self._session_params = None
+        self._home = None
+        self._pwd = None
+        self._ls_cache.clear()
+        self._close_client()
+        self._close_shell()
+
+    def _resolve_connection_params(self) -> Optional[Tuple[str, int, str]]:
+        """(host, port, username) paramiko should connect with, or None.
+
+        Direct-connection settings are used as-is; in PuTTY-session mode
+        the saved session is read from the registry (Windows only) so the
+        persistent connection works for session users too.
+        """
+        if self.use_direct_connection:
+            if self.ssh_host and self.ssh_username:
+                return self.ssh_host, int(self.ssh_port), self.ssh_username
+            return None
+        if self._session_params is None:
+            self._session_params = self._read_putty_session() or False
+        return self._session_params or None
+
+    def _read_putty_session(self) -> Optional[Tuple[str, int, str]]:
+        """Read host/port/username of the saved PuTTY session from the registry"""
+        if os.name != "nt":
+            return None
+        try:
+            import winreg
+            key_path = rf"Software\SimonTatham\PuTTY\Sessions\{self.session_name}"
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+                host, _ = winreg.QueryValueEx(key, "HostName")
+                port, _ = winreg.QueryValueEx(key, "PortNumber")
+                username = ""
+                try:
+                    username, _ = winreg.QueryValueEx(key, "UserName")
+                except OSError:
+                    pass
+            # PuTTY allows user@host in the HostName field
+            if not username and "@" in host:
+                username, _, host = host.partition("@")
+            if host and username:
+                return host, int(port), username
+        except OSError:
+            pass
+        return None
+
+    def _get_ssh_client(self):
+        """Get the shared paramiko client, connecting on first use.
+
+        Returns None when paramiko is unavailable or no host/port/user can
+        be resolved for the current mode; callers then fall back to
+        plink/pscp.
+        """
+        if paramiko is None or self._resolve_connection_params() is None:
+            return None
+        with self._client_lock:
+            if self._ssh_client is not None:
+                transport = self._ssh_client.get_transport()
+                if transport is not None and transport.is_active():
+                    return self._ssh_client
+                self._ssh_client = None
+                self._sftp_client = None
+            try:
+                self._ssh_client = self._connect_client()
+            except Exception:
+                # Key/agent auth not set up; plink fallback handles it
+                self._ssh_client = None
+            return self._ssh_client
+
+    def _connect_client(self):
+        """Open and authenticate a new paramiko client (raises on failure)"""
+        host, port, username = self._resolve_connection_params()
+        client = paramiko.SSHClient()
+        client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            host,
+            port=port,
+            username=username,
+            allow_agent=True,
+            look_for_keys=True,
+            timeout=15
+        )
+        # Large socket buffers + no Nagle so SFTP throughput isn't
+        # capped by the default window on high-latency links
+        transport = client.get_transport()
+        if transport is not None and transport.sock is not None:
+            try:
+                transport.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32 * 1024 * 1024)
+                transport.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 32 * 1024 * 1024)
+                transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+        return client
+
+    def _get_pool(self) -> Optional["SSHConnectionPool"]:
+        """Get the connection pool used by execute_command, or None"""
+        if paramiko is None or self._resolve_connection_params() is None:
+            return None
+        with self._client_lock:
+            if self._pool is None:
+                self._pool = SSHConnectionPool(self._connect_client)
+            return self._pool
+
+    def _get_sftp_client(self):
+        """Get the shared SFTP channel over the paramiko connection, or None"""
+        if self._get_ssh_client() is None:
+            return None
+        with self._client_lock:
+            if self._sftp_client is None and self._ssh_client is not None:
+                try:
+                    self._sftp_client = self._ssh_client.open_sftp()
+                except Exception:
+                    self._sftp_client = None
+            return self._sftp_client
+
+    def _close_client(self):
+        """Drop the paramiko connections (e.g. after connection settings change)"""
+        with self._client_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+            if self._sftp_client is not None:
+                try:
+                    self._sftp_client.close()
+                except Exception:
+                    pass
+                self._sftp_client = None
+            if self._ssh_client is not None:
+                try:
+                    self._ssh_client.close()
+                except Exception:
+                    pass
+                self._ssh_client = None
+
     def _get_base_cmd(self) -> List[str]:
-        """Get the base command for SSH operations"""
-        if self.use_direct_connection and self.ssh_host and self.ssh_username:
-            return [self.plink_path, "-batch", "-ssh", f"{self.ssh_username}@{self.ssh_host}", "-P", self.ssh_port]
-        else:
-            return [self.plink_path, "-batch", self.session_name]
-            
+        """Get the base command for SSH operations (cached between connection changes)"""
+        if self._base_cmd is None:
+            if self.use_direct_connection and self.ssh_host and self.ssh_username:
+                self._base_cmd = [self.plink_path, "-batch", "-share", "-ssh", f"{self.ssh_username}@{self.ssh_host}", "-P", self.ssh_port]
+            else:
+                self._base_cmd = [self.plink_path, "-batch", "-share", self.session_name]
+        return self._base_cmd
+
+    def start_master_connection(self):
+        """Start a background plink process that holds a shared SSH connection.
+
+        With -share, plink acts like OpenSSH's ControlMaster: the first process
+        opens the real connection and later invocations attach to it, skipping
+        the TCP + SSH handshake on every command.
+        """
+        if not self.plink_path:
+            return
+        if self.master_process and self.master_process.poll() is None:
+            return  # Master already running
+
+        try:
+            # -N: no remote command, just hold the connection open for sharing
+            master_cmd = self._get_base_cmd() + ["-N"]
+            self.master_process = subprocess.Popen(
+                master_cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_POPEN_OPTS
+            )
+        except Exception:
+            # Sharing is a pure optimization; individual commands still work without it
+            self.master_process = None
+
+    def _get_shell(self):
+        """Get the long-lived remote shell, starting it on first use.
+
+        A single plink process runs bash on the server and stays attached;
+        each execute_command then costs one network round-trip instead of
+        a process spawn plus (without the master) a full SSH handshake.
+        """
+        if not self.plink_path:
+            return None
+        if self._shell is not None and self._shell.poll() is None:
+            return self._shell
+        try:
+            self._shell = subprocess.Popen(
+                self._get_base_cmd() + ["bash --noprofile --norc -s"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                # Own process group so a timeout can take out any local
+                # children along with the shell (POSIX; no-op on Windows)
+                start_new_session=(os.name != "nt"),
+                **_POPEN_OPTS
+            )
+        except Exception:
+            self._shell = None
+        return self._shell
+
+    def _close_shell(self):
+        """Drop the persistent shell (settings change or shutdown)"""
+        shell, self._shell = self._shell, None
+        if shell is not None and shell.poll() is None:
+            try:
+                shell.terminate()
+            except Exception:
+                pass
+
+    def _execute_via_shell(self, command: str, timeout: int) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """Run a command on the persistent shell, or None if unavailable.
+
+        The command is followed by a printf of a per-call marker and $?;
+        stdout is read until the marker arrives. stderr is merged into
+        stdout, so on failure the combined output becomes the error text.
+        A timer kills the shell if the deadline passes (the next call
+        starts a fresh one).
+        """
+        shell = self._get_shell()
+        if shell is None:
+            return None
+        marker = os.urandom(8).hex()
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            # Kill the whole group: any local child still holding the
+            # stdout pipe would otherwise keep readline blocked past the
+            # deadline
+            try:
+                os.killpg(shell.pid, signal.SIGKILL)
+            except Exception:
+                shell.kill()
+
+        with self._shell_lock:
+            try:
+                # </dev/null so commands can't swallow the marker printf
+                shell.stdin.write(f"{{ {command}\n}} </dev/null\nprintf '::END::%s::%s\\n' {marker} $?\n")
+                shell.stdin.flush()
+            except Exception:
+                self._close_shell()
+                return None
+            timer = threading.Timer(timeout, _kill)
+            timer.start()
+            sentinel = f"::END::{marker}::"
+            lines = []
+            try:
+                while True:
+                    line = shell.stdout.readline()
+                    if not line:
+                        # Shell died mid-command (or the timer fired)
+                        self._close_shell()
+                        if timed_out.is_set():
+                            return None, "Command timed out"
+                        return None
+                    if sentinel in line:
+                        # Output without a trailing newline glues the
+                        # marker onto the last line; keep the prefix
+                        prefix, _, status = line.partition(sentinel)
+                        if prefix:
+                            lines.append(prefix)
+                        code = status.rstrip("\n")
+                        break
+                    lines.append(line)
+            finally:
+                timer.cancel()
+        output = "".join(lines)
+        if code == "0":
+            return output, ""
+        return None, output.strip() or f"Command exited with status {code}"
+
+    def close(self):
+        """Close the paramiko connection, shell and shared master process"""
+        self._close_client()
+        self._close_shell()
+        if self.master_process and self.master_process.poll() is None:
+            try:
+                self.master_process.terminate()
+                self.master_process.wait(timeout=5)
+            except Exception:
+                try:
+                    self.master_process.kill()
+                except Exception:
+                    pass
+        self.master_process = None
+
+    def __del__(self):
+        # Best-effort cleanup so an abandoned manager doesn't leave a
+        # hidden plink master (and its SSH connection) running
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def test_connection(self) -> Tuple[bool, str]:
         """Test SSH connection to the server"""
         if not self.plink_path:
@@ -40,7 +401,7 @@ class SSHManager:
             base_cmd = self._get_base_cmd()
             test_cmd = base_cmd + ["echo 'Connection test successful'"]
             
-            result = subprocess.run(test_cmd, capture_output=True, text=True, timeout=15)
+            result = subprocess.run(test_cmd, capture_output=True, text=True, timeout=15, **_POPEN_OPTS)
             
             if result.returncode == 0:
                 return True, "Connection successful"
@@ -55,14 +416,49 @@ class SSHManager:
             
     def execute_command(self, command: str, timeout: int = 30) -> Tuple[Optional[str], Optional[str]]:
         """Execute a command via SSH"""
+        pool = self._get_pool()
+        if pool is not None:
+            try:
+                with pool.borrow() as client:
+                    try:
+                        _, stdout, stderr = client.exec_command(command, timeout=timeout)
+                        out = stdout.read().decode(errors="replace")
+                        err = stderr.read().decode(errors="replace")
+                        code = stdout.channel.recv_exit_status()
+                    except Exception as e:
+                        # The exec request may already have reached the
+                        # server; falling back to plink here would run a
+                        # non-idempotent command a second time
+                        return None, str(e)
+                    if code == 0:
+                        return out, err
+                    else:
+                        return None, err
+            except Exception:
+                # Could not check out a connected client; nothing was
+                # dispatched, so a fresh plink run is safe
+                pass
+
         if not self.plink_path:
             return None, "plink.exe not found"
-            
+
+        # Persistent shell: no process spawn at all for repeat commands
+        shell_result = self._execute_via_shell(command, timeout)
+        if shell_result is not None:
+            return shell_result
+
         try:
+            # ControlPersist-style: if the shared master died (network blip,
+            # server restart), bring it back so this and later invocations
+            # attach instead of each paying a full handshake
+            if self.master_process is not None and self.master_process.poll() is not None:
+                self.master_process = None
+                self.start_master_connection()
+
             base_cmd = self._get_base_cmd()
             cmd = base_cmd + [command]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, **_POPEN_OPTS)
             
             if result.returncode == 0:
                 return result.stdout, result.stderr
@@ -74,8 +470,110 @@ class SSHManager:
         except Exception as e:
             return None, str(e)
             
+    async def stream_command(self, command: str):
+        """Execute a command via SSH and yield stdout lines as they arrive.
+
+        Used for long-running commands like 'tail -f' where the caller wants
+        output incrementally instead of one big buffer at exit. The subprocess
+        is terminated when the caller stops iterating (e.g. task cancelled),
+        so a consumer that breaks on the first interesting line never pays
+        for the rest of the output — parsing overlaps the network read and
+        peak memory stays at one line instead of the whole stream.
+
+        stderr goes to its own pipe (merging it into stdout would feed
+        plink banners to consumers that parse the stream); if the command
+        exits non-zero its last stderr lines are raised so the failure
+        reaches the caller instead of presenting as an empty stream.
+        """
+        if not self.plink_path:
+            return
+
+        base_cmd = self._get_base_cmd()
+        proc = await asyncio.create_subprocess_exec(
+            *base_cmd, command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+        # Drain stderr concurrently so a chatty command can't fill the pipe
+        # buffer and deadlock; only the tail is kept for the error message
+        stderr_tail = collections.deque(maxlen=20)
+
+        async def drain():
+            while True:
+                line = await proc.stderr.readline()
+                if not line:
+                    break
+                stderr_tail.append(line.decode(errors="replace").rstrip("\n"))
+
+        stderr_task = asyncio.ensure_future(drain())
+        try:
+            assert proc.stdout is not None
+            while True:
+                line = await proc.stdout.readline()
+                if not line:
+                    break
+                yield line.decode(errors="replace").rstrip("\n")
+            await stderr_task
+            if await proc.wait() != 0 and stderr_tail:
+                raise RuntimeError("\n".join(stderr_tail))
+        finally:
+            stderr_task.cancel()
+            if proc.returncode is None:
+                try:
+                    proc.terminate()
+                except ProcessLookupError:
+                    pass
+
+    def _run_sftp_batch(self, sftp, sftp_commands: List[str]) -> Tuple[str, str]:
+        """Translate a psftp-style command batch onto the native SFTP channel.
+
+        The whole batch is parsed before anything runs, so an
+        untranslatable command raises ValueError without side effects and
+        the caller can hand the batch to plink instead.
+        """
+        ops = []
+        for command in sftp_commands:
+            parts = shlex.split(command)
+            if not parts:
+                continue
+            verb, args = parts[0].lower(), parts[1:]
+            if verb == "pwd" and not args:
+                ops.append(lambda: sftp.normalize("."))
+            elif verb == "mkdir" and len(args) == 1:
+                ops.append(lambda p=args[0]: sftp.mkdir(self._sftp_path(p)))
+            elif verb in ("rm", "del") and len(args) == 1:
+                ops.append(lambda p=args[0]: sftp.remove(self._sftp_path(p)))
+            elif verb == "rmdir" and len(args) == 1:
+                ops.append(lambda p=args[0]: sftp.rmdir(self._sftp_path(p)))
+            elif verb == "put" and len(args) == 2:
+                ops.append(lambda l=args[0], r=args[1]: sftp.put(l, self._sftp_path(r)))
+            elif verb == "get" and len(args) == 2:
+                ops.append(lambda r=args[0], l=args[1]: sftp.get(self._sftp_path(r), l))
+            else:
+                raise ValueError(f"Untranslatable SFTP command: {command}")
+        out_lines = [result for result in (op() for op in ops) if isinstance(result, str)]
+        return "\n".join(out_lines), ""
+
     def execute_sftp_commands(self, sftp_commands: List[str], timeout: int = 30) -> Tuple[Optional[str], Optional[str]]:
-        """Execute SFTP commands through a single connection"""
+        """Execute SFTP commands through a single connection.
+
+        On the shared paramiko channel the batch runs as native SFTP
+        requests — no subprocess, no handshake, and transfers keep their
+        pipelining. Batches the translator doesn't understand go to
+        plink's sftp subsystem unchanged.
+        """
+        sftp = self._get_sftp_client()
+        if sftp is not None:
+            try:
+                result = self._run_sftp_batch(sftp, sftp_commands)
+                self.invalidate_listing()
+                return result
+            except ValueError:
+                pass  # unknown verb; let plink's psftp interpret it
+            except Exception as e:
+                return None, str(e)
+
         if not self.plink_path:
             return None, "plink.exe not found"
             
@@ -85,39 +583,102 @@ class SSHManager:
             
             # Choose connection method
             if self.use_direct_connection and self.ssh_host and self.ssh_username:
-                cmd = [self.plink_path, "-batch", "-ssh", f"{self.ssh_username}@{self.ssh_host}", "-P", self.ssh_port, "sftp"]
+                cmd = [self.plink_path, "-batch", "-share", "-ssh", f"{self.ssh_username}@{self.ssh_host}", "-P", self.ssh_port, "sftp"]
             else:
-                cmd = [self.plink_path, "-batch", self.session_name, "sftp"]
+                cmd = [self.plink_path, "-batch", "-share", self.session_name, "sftp"]
             
             result = subprocess.run(
                 cmd,
                 input=sftp_script,
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                timeout=timeout,
+                **_POPEN_OPTS
             )
-            
+
             if result.returncode == 0:
+                self.invalidate_listing()
                 return result.stdout, result.stderr
             else:
                 return None, result.stderr
-            
+
         except subprocess.TimeoutExpired:
             return None, "SFTP command timed out"
         except Exception as e:
             return None, str(e)
             
+    def test_sftp_connection(self) -> Tuple[bool, str]:
+        """Cheaply verify that SFTP works over the current connection.
+
+        A single stat of the remote home directory proves liveness; no
+        temp file is created or transferred.
+        """
+        sftp = self._get_sftp_client()
+        if sftp is not None:
+            try:
+                sftp.stat(".")
+                return True, "SFTP connection successful"
+            except Exception as e:
+                return False, str(e)
+        # plink path: one 'pwd' over the sftp subsystem, still no transfer
+        stdout, stderr = self.execute_sftp_commands(["pwd"], timeout=15)
+        if stdout is not None:
+            return True, "SFTP connection successful"
+        return False, stderr or "SFTP test failed"
+
     def get_full_path(self, path: str) -> Tuple[Optional[str], Optional[str]]:
-        """Get the full absolute path by expanding ~ and resolving relative paths"""
-        # Use 'readlink -f' to get the absolute path, expanding ~
-        return self.execute_command(f"readlink -f {path}")
+        """Get the full absolute path by expanding ~ and resolving relative paths.
+
+        Successful resolutions are cached for the life of the connection,
+        so repeat lookups of the usual config/server paths cost nothing.
+        """
+        cached = self._path_cache.get(path)
+        if cached is not None:
+            return cached, None
+        # A leading ~ is the only thing the usual paths need resolved, and
+        # that's a pure string substitution once $HOME is known — no
+        # round-trip. Anything else (relative paths, symlinks) still goes
+        # through readlink -f on the server.
+        if path == "~" or path.startswith("~/"):
+            home = self._get_home()
+            if home:
+                full = home + path[1:]
+                self._path_cache[path] = full
+                return full, None
+        stdout, stderr = self.execute_command(f"readlink -f {path}")
+        if stdout and stdout.strip():
+            self._path_cache[path] = stdout
+        return stdout, stderr
+
+    def _get_home(self) -> Optional[str]:
+        """Remote $HOME, fetched once per connection settings"""
+        return self._session_constants()[0]
+
+    def _session_constants(self) -> Tuple[Optional[str], Optional[str]]:
+        """($HOME, login directory), fetched together in one round-trip.
+
+        Both are constant for a session, so the first caller pays the
+        trip and everyone after reads the cached values.
+        """
+        if self._home is None or self._pwd is None:
+            stdout, _ = self.execute_command("echo $HOME; pwd")
+            lines = (stdout or "").splitlines()
+            if len(lines) >= 2 and lines[0].strip():
+                self._home = lines[0].strip()
+                self._pwd = lines[1].strip()
+        return self._home, self._pwd
         
-    def download_file(self, remote_path: str, local_path: str) -> Tuple[bool, str]:
-        """Download a file from the server using PSCP"""
-        if not self.pscp_path:
-            return False, "pscp.exe not found"
-            
-        try:
+    def download_file(self, remote_path: str, local_path: str, resolve: bool = True) -> Tuple[bool, str]:
+        """Download a file from the server over the shared SFTP channel.
+
+        PSCP is kept only as the legacy fallback for setups without
+        paramiko — per-call sessions make it pathological for anything
+        called in a loop.
+
+        Pass resolve=False when remote_path is already absolute to skip the
+        readlink round-trip.
+        """
+        if resolve:
             # Get the full absolute path first
             full_path_stdout, full_path_stderr = self.get_full_path(remote_path)
             if full_path_stdout:
@@ -125,14 +686,37 @@ class SSHManager:
             else:
                 # Fallback to original path if expansion fails
                 full_remote_path = remote_path
-                
+        else:
+            full_remote_path = remote_path
+
+        sftp = self._get_sftp_client()
+        if sftp is not None:
+            try:
+                # prefetch() keeps many read requests in flight so the
+                # transfer is bandwidth-bound instead of one 32 KB
+                # request/ack round-trip at a time; 64 outstanding requests
+                # is enough to fill a 100 ms RTT link
+                with sftp.open(full_remote_path, "rb") as remote_f, open(local_path, "wb") as local_f:
+                    remote_f.prefetch(max_concurrent_requests=self.SFTP_CONCURRENCY)
+                    shutil.copyfileobj(remote_f, local_f, self.TRANSFER_CHUNK)
+                return True, "Download successful"
+            except Exception as e:
+                return False, str(e)
+
+        if not self.pscp_path:
+            return False, "pscp.exe not found"
+
+        try:
             # Choose connection method for PSCP
+            # -C: SSH-level compression; config/save payloads compress well
+            # and the fallback path is bandwidth-bound, not CPU-bound
             if self.use_direct_connection and self.ssh_host and self.ssh_username:
-                cmd = [self.pscp_path, "-batch", "-ssh", "-P", self.ssh_port, f"{self.ssh_username}@{self.ssh_host}:{full_remote_path}", local_path]
+                cmd = [self.pscp_path, "-batch", "-share", "-C", "-ssh", "-P", self.ssh_port, f"{self.ssh_username}@{self.ssh_host}:{full_remote_path}", local_path]
             else:
-                cmd = [self.pscp_path, "-batch", f"{self.session_name}:{full_remote_path}", local_path]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                cmd = [self.pscp_path, "-batch", "-share", "-C", f"{self.session_name}:{full_remote_path}", local_path]
+
+            # Generous timeout: save-file transfers can run for minutes
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600, **_POPEN_OPTS)
             
             if result.returncode == 0 and os.path.exists(local_path):
                 return True, "Download successful"
@@ -145,15 +729,19 @@ class SSHManager:
         except Exception as e:
             return False, str(e)
             
-    def upload_file(self, local_path: str, remote_path: str) -> Tuple[bool, str]:
-        """Upload a file to the server using PSCP"""
+    def upload_file(self, local_path: str, remote_path: str, resolve: bool = True) -> Tuple[bool, str]:
+        """Upload a file to the server over the shared SFTP channel.
+
+        PSCP is kept only as the legacy fallback for setups without
+        paramiko.
+
+        Pass resolve=False when remote_path is already absolute to skip the
+        readlink round-trip.
+        """
         if not os.path.exists(local_path):
             return False, "Local file not found"
-            
-        if not self.pscp_path:
-            return False, "pscp.exe not found"
-            
-        try:
+
+        if resolve:
             # Get the full absolute path first
             full_path_stdout, full_path_stderr = self.get_full_path(remote_path)
             if full_path_stdout:
@@ -161,16 +749,46 @@ class SSHManager:
             else:
                 # Fallback to original path if expansion fails
                 full_remote_path = remote_path
-                
+        else:
+            full_remote_path = remote_path
+
+        sftp = self._get_sftp_client()
+        if sftp is not None:
+            try:
+                # Pipelined writes skip the per-block ack wait; the error
+                # check happens when the file is closed. The local file is
+                # memory-mapped so chunks page straight from the file cache
+                # instead of through a read-buffer copy
+                with open(local_path, "rb") as local_f, sftp.open(full_remote_path, "wb") as remote_f:
+                    remote_f.set_pipelined(True)
+                    try:
+                        source = mmap.mmap(local_f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (ValueError, OSError):
+                        # Empty or unmappable file; plain reads are fine
+                        shutil.copyfileobj(local_f, remote_f, self.TRANSFER_CHUNK)
+                    else:
+                        with source:
+                            shutil.copyfileobj(source, remote_f, self.TRANSFER_CHUNK)
+                self.invalidate_listing()
+                return True, "Upload successful"
+            except Exception as e:
+                return False, str(e)
+
+        if not self.pscp_path:
+            return False, "pscp.exe not found"
+
+        try:
             # Choose connection method for PSCP
             if self.use_direct_connection and self.ssh_host and self.ssh_username:
-                cmd = [self.pscp_path, "-batch", "-ssh", "-P", self.ssh_port, local_path, f"{self.ssh_username}@{self.ssh_host}:{full_remote_path}"]
+                cmd = [self.pscp_path, "-batch", "-share", "-C", "-ssh", "-P", self.ssh_port, local_path, f"{self.ssh_username}@{self.ssh_host}:{full_remote_path}"]
             else:
-                cmd = [self.pscp_path, "-batch", local_path, f"{self.session_name}:{full_remote_path}"]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
+                cmd = [self.pscp_path, "-batch", "-share", "-C", local_path, f"{self.session_name}:{full_remote_path}"]
+
+            # Generous timeout: save-file transfers can run for minutes
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600, **_POPEN_OPTS)
+
             if result.returncode == 0:
+                self.invalidate_listing()
                 return True, "Upload successful"
             else:
                 error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
@@ -181,8 +799,160 @@ class SSHManager:
         except Exception as e:
             return False, str(e)
             
+    def stream_to_file(self, command: str, local_path: str, timeout: int = 600) -> Tuple[bool, str]:
+        """Run a remote command and stream its raw stdout into a local file.
+
+        Lets archives be piped straight over the connection (tar czf -)
+        instead of being written to remote disk and downloaded afterwards.
+        """
+        pool = self._get_pool()
+        if pool is not None:
+            try:
+                with pool.borrow() as client:
+                    _, stdout, stderr = client.exec_command(command, timeout=timeout)
+                    with open(local_path, "wb") as local_f:
+                        shutil.copyfileobj(stdout, local_f, self.TRANSFER_CHUNK)
+                    if stdout.channel.recv_exit_status() == 0:
+                        return True, "Stream successful"
+                    return False, stderr.read().decode(errors="replace").strip()
+            except Exception:
+                # Fall through to a plink pipe
+                pass
+
+        if not self.plink_path:
+            return False, "plink.exe not found"
+
+        try:
+            base_cmd = self._get_base_cmd()
+            with open(local_path, "wb") as local_f:
+                result = subprocess.run(
+                    base_cmd + [command],
+                    stdout=local_f,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout,
+                    **_POPEN_OPTS
+                )
+            if result.returncode == 0:
+                return True, "Stream successful"
+            return False, result.stderr.decode(errors="replace").strip()
+        except subprocess.TimeoutExpired:
+            return False, "Stream timed out"
+        except Exception as e:
+            return False, str(e)
+
+    @staticmethod
+    def _sftp_path(path: str) -> str:
+        """SFTP has no shell, so ~ has to become a home-relative path"""
+        if path == "~":
+            return "."
+        if path.startswith("~/"):
+            return "." + path[1:]
+        return path
+
+    def transfer_many(self, pairs: List[Tuple[str, str]], direction: str = "download",
+                      max_workers: int = 4) -> List[Tuple[bool, str]]:
+        """Transfer several files concurrently, one pooled connection each.
+
+        pairs is a list of (remote_path, local_path); direction is
+        "download" or "upload". Independent files overlap their network
+        flight time across pool connections (paramiko transports aren't
+        thread-safe, so each worker borrows its own). Falls back to
+        sequential plink/pscp transfers when the pool is unavailable.
+        Results keep the order of pairs.
+        """
+        if direction not in ("download", "upload"):
+            raise ValueError(f"Unknown transfer direction: {direction}")
+
+        pool = self._get_pool()
+        if pool is None:
+            if direction == "download":
+                return [self.download_file(remote, local) for remote, local in pairs]
+            return [self.upload_file(local, remote) for remote, local in pairs]
+
+        def _one(pair):
+            remote_path, local_path = pair
+            try:
+                with pool.borrow() as client:
+                    sftp = client.open_sftp()
+                    try:
+                        if direction == "download":
+                            sftp.get(self._sftp_path(remote_path), local_path)
+                        else:
+                            sftp.put(local_path, self._sftp_path(remote_path))
+                    finally:
+                        sftp.close()
+                return True, "Transfer successful"
+            except Exception as e:
+                return False, str(e)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(len(pairs), 1))) as executor:
+            return list(executor.map(_one, pairs))
+
+    def upload_directory(self, local_dir: str, remote_dir: str, max_workers: int = 4) -> Tuple[bool, str]:
+        """Upload a local directory tree, transferring files concurrently.
+
+        The remote directory skeleton is created with one mkdir -p batch,
+        then the files fan out over transfer_many's pooled workers so N
+        small files cost ~N/workers round-trips instead of N.
+        """
+        if not os.path.isdir(local_dir):
+            return False, "Local directory not found"
+
+        base = os.path.abspath(local_dir)
+        remote_dirs = []
+        pairs = []
+        for root, _, files in os.walk(base):
+            rel = os.path.relpath(root, base)
+            remote_root = remote_dir.rstrip("/") + ("" if rel == "." else "/" + rel.replace(os.sep, "/"))
+            remote_dirs.append(remote_root)
+            for name in files:
+                pairs.append((remote_root + "/" + name, os.path.join(root, name)))
+
+        # One round-trip creates every directory; paths stay unquoted so
+        # a leading ~ expands
+        _, stderr = self.execute_command("mkdir -p " + " ".join(remote_dirs))
+        if stderr and stderr.strip():
+            return False, f"Failed to create remote directories: {stderr.strip()}"
+
+        results = self.transfer_many(pairs, direction="upload", max_workers=max_workers)
+        failures = [message for ok, message in results if not ok]
+        if failures:
+            return False, f"{len(failures)} of {len(pairs)} files failed: {failures[0]}"
+        return True, f"Uploaded {len(pairs)} files"
+
+    def probe(self, spec: dict, timeout: int = 30) -> dict:
+        """Run several filesystem probes in one SSH round-trip.
+
+        spec maps a result name to a (kind, path) tuple where kind is
+        "file", "dir" or "resolve". Existence kinds come back as "1"/"0",
+        "resolve" as the readlink -f output (empty on failure). All
+        probes ride one remote shell invocation, so N checks cost one
+        round-trip instead of N. Paths are left unquoted so ~ expands.
+        """
+        parts = []
+        for name, (kind, path) in spec.items():
+            if kind == "file":
+                parts.append(f'echo "::{name}::$(test -f {path} && echo 1 || echo 0)"')
+            elif kind == "dir":
+                parts.append(f'echo "::{name}::$(test -d {path} && echo 1 || echo 0)"')
+            elif kind == "resolve":
+                parts.append(f'echo "::{name}::$(readlink -f {path} 2>/dev/null)"')
+            else:
+                raise ValueError(f"Unknown probe kind: {kind}")
+        stdout, _ = self.execute_command("; ".join(parts), timeout=timeout)
+        results = {}
+        for line in (stdout or "").splitlines():
+            if line.startswith("::"):
+                name, _, value = line[2:].partition("::")
+                if name in spec:
+                    results[name] = value.strip()
+        return results
+
     def get_current_directory(self) -> Tuple[Optional[str], Optional[str]]:
-        """Get the current directory on the server"""
+        """Get the current directory on the server (constant per session, cached)"""
+        _, pwd = self._session_constants()
+        if pwd:
+            return pwd, None
         return self.execute_command("pwd")
         
     def list_directory(self, path: str = ".") -> Tuple[Optional[str], Optional[str]]:
@@ -191,44 +961,131 @@ class SSHManager:
         
     def test_directory_exists(self, path: str) -> Tuple[bool, str]:
         """Test if a directory exists on the server"""
+        # One SFTP stat packet beats opening an exec channel and forking
+        # a remote shell just to run test -d
+        sftp = self._get_sftp_client()
+        if sftp is not None:
+            try:
+                st = sftp.stat(self._sftp_path(path))
+                if stat.S_ISDIR(st.st_mode):
+                    return True, "Directory exists"
+                return False, "Directory not found"
+            except IOError:
+                return False, "Directory not found"
+            except Exception:
+                pass  # channel died; fall back to the shell probe
+
         stdout, stderr = self.execute_command(f"test -d '{path}' && echo 'EXISTS' || echo 'NOT_FOUND'")
-        
+
         if stdout and "EXISTS" in stdout:
             return True, "Directory exists"
         else:
             return False, "Directory not found"
-            
+
     def test_file_exists(self, path: str) -> Tuple[bool, str]:
         """Test if a file exists on the server"""
+        sftp = self._get_sftp_client()
+        if sftp is not None:
+            try:
+                st = sftp.stat(self._sftp_path(path))
+                if stat.S_ISREG(st.st_mode):
+                    return True, "File exists"
+                return False, "File not found"
+            except IOError:
+                return False, "File not found"
+            except Exception:
+                pass  # channel died; fall back to the shell probe
+
         stdout, stderr = self.execute_command(f"test -f '{path}' && echo 'EXISTS' || echo 'NOT_FOUND'")
-        
+
         if stdout and "EXISTS" in stdout:
             return True, "File exists"
         else:
             return False, "File not found"
             
+    # Known install locations for PalWorldSettings.ini, most common first;
+    # alternates cover the hidden-steam layout and manual installs
+    CONFIG_CANDIDATES = [
+        "~/Steam/steamapps/common/PalServer/Pal/Saved/Config/LinuxServer/",
+        "~/.steam/steam/steamapps/common/PalServer/Pal/Saved/Config/LinuxServer/",
+        "/opt/palserver/Pal/Saved/Config/LinuxServer/",
+    ]
+
     def find_config_file(self) -> Tuple[Optional[str], str]:
-        """Find the PalWorldSettings.ini file on the server"""
-        # Try to change to the Steam directory and check for the config file
-        steam_path = "~/Steam/steamapps/common/PalServer/Pal/Saved/Config/LinuxServer/"
-        
-        # First try to list the directory contents to see if it exists and what's there
-        stdout, stderr = self.execute_command(f"cd {steam_path} && ls -la")
-        
-        if stdout:
-            # Check if PalWorldSettings.ini appears anywhere in the output
-            lines = stdout.strip().split('\n')
-            for line in lines:
-                if 'PalWorldSettings.ini' in line:
-                    return steam_path + "PalWorldSettings.ini", "Config file found"
-            return None, "PalWorldSettings.ini not found in Steam directory"
-        elif stderr and "No such file or directory" in stderr:
-            return None, f"Steam directory not found at {steam_path}"
-        else:
+        """Find the PalWorldSettings.ini file on the server, trying known install locations"""
+        # SFTP fast path: one structured listdir per candidate, an exact
+        # name match, and no shell or locale-sensitive ls output anywhere
+        sftp = self._get_sftp_client()
+        if sftp is not None:
+            try:
+                found_dir = False
+                for steam_path in self.CONFIG_CANDIDATES:
+                    try:
+                        names = sftp.listdir(self._sftp_path(steam_path))
+                    except IOError:
+                        continue
+                    found_dir = True
+                    if "PalWorldSettings.ini" in names:
+                        ini_path = steam_path + "PalWorldSettings.ini"
+                        try:
+                            self._path_cache.setdefault(ini_path, sftp.normalize(self._sftp_path(ini_path)))
+                        except IOError:
+                            pass
+                        return ini_path, "Config file found"
+                if found_dir:
+                    return None, "PalWorldSettings.ini not found in Steam directory"
+                return None, f"Steam directory not found at {self.CONFIG_CANDIDATES[0]}"
+            except Exception:
+                pass  # channel died; fall back to the shell probe
+
+        # One compound probe checks every candidate in a single round-trip,
+        # instead of shipping directory listings back and grepping them
+        # client-side; latency is one trip and O(1) bytes come back
+        # regardless of candidate count or directory size (the full
+        # listing stays available via list_steam_config_files when a miss
+        # needs diagnosing)
+        spec = {}
+        for i, steam_path in enumerate(self.CONFIG_CANDIDATES):
+            spec[f"ini{i}"] = ("file", steam_path + "PalWorldSettings.ini")
+            spec[f"dir{i}"] = ("dir", steam_path)
+            spec[f"path{i}"] = ("resolve", steam_path + "PalWorldSettings.ini")
+        results = self.probe(spec)
+
+        if not results:
             return None, "Could not access Steam directory"
+        for i, steam_path in enumerate(self.CONFIG_CANDIDATES):
+            if results.get(f"ini{i}") == "1":
+                ini_path = steam_path + "PalWorldSettings.ini"
+                # The probe already resolved the absolute path; seed the
+                # cache so the download that usually follows skips its
+                # readlink trip
+                if results.get(f"path{i}"):
+                    self._path_cache[ini_path] = results[f"path{i}"]
+                return ini_path, "Config file found"
+        if any(results.get(f"dir{i}") == "1" for i in range(len(self.CONFIG_CANDIDATES))):
+            return None, "PalWorldSettings.ini not found in Steam directory"
+        return None, f"Steam directory not found at {self.CONFIG_CANDIDATES[0]}"
             
+    def invalidate_listing(self, path: Optional[str] = None):
+        """Drop cached directory listings after a remote mutation"""
+        if path is None:
+            self._ls_cache.clear()
+        else:
+            self._ls_cache.pop(path, None)
+
     def list_steam_config_files(self) -> Tuple[Optional[str], Optional[str]]:
-        """List all files in the Steam config directory"""
+        """List all files in the Steam config directory (cached for 2 s)"""
         steam_path = "~/Steam/steamapps/common/PalServer/Pal/Saved/Config/LinuxServer/"
-        
-        return self.execute_command(f"cd {steam_path} && ls -la") 
\ No newline at end of file
+
+        # ls -la here is display-only output for the log panel — nothing
+        # may parse it (locale- and filename-fragile); machine consumers
+        # use sftp.listdir or the probe instead.
+        # GUI flows fire discovery and listing back to back at the same
+        # directory; a short TTL turns the second round-trip into a hit
+        cached = self._ls_cache.get(steam_path)
+        if cached is not None and time.monotonic() - cached[0] < 2.0:
+            return cached[1]
+        result = self.execute_command(f"cd {steam_path} && ls -la")
+        if result[0] is not None:
+            self._ls_cache[steam_path] = (time.monotonic(), result)
+        return result 
\ No newline at end of file
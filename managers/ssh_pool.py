@@ -0,0 +1,69 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+class SSHConnectionPool:
+    """Small pool of pre-authenticated paramiko clients shared by worker threads.
+
+    Several GUI actions fire worker threads at once (status refresh, log
+    fetch, update check); handing each its own already-authenticated
+    client avoids both re-dialing per action and serializing every
+    command through a single connection.
+    """
+
+    def __init__(self, factory, size: int = 4):
+        self._factory = factory
+        self._size = size
+        self._created = 0
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        # Warm vs cold checkout counters, readable for diagnostics
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def borrow(self):
+        """Check out a connected client, returning it to the pool afterwards"""
+        client = self._acquire()
+        try:
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def _acquire(self):
+        while True:
+            try:
+                client = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if self._created < self._size:
+                        self._created += 1
+                        self.misses += 1
+                        try:
+                            return self._factory()
+                        except Exception:
+                            self._created -= 1
+                            raise
+                # Pool is full; wait for a client to come back
+                client = self._idle.get()
+            transport = client.get_transport()
+            if transport is not None and transport.is_active():
+                self.hits += 1
+                return client
+            # Dead connection: drop it and try again
+            with self._lock:
+                self._created -= 1
+
+    def close(self):
+        """Close every idle client and reset the pool"""
+        with self._lock:
+            while True:
+                try:
+                    client = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    client.close()
+                except Exception:
+                    pass
+            self._created = 0